@@ -1,29 +1,155 @@
 import os
 import discord
 from discord import app_commands
-import io
 import asyncio
+import atexit
+import logging
+import logging.handlers
+import queue
 import time
 import re
 import sys
+import threading
+from collections import OrderedDict
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
 from datetime import datetime, timedelta
-from contextlib import redirect_stdout, redirect_stderr
+from contextlib import contextmanager
+from functools import lru_cache, partial
+from urllib.parse import quote
+from mwclient.errors import APIError
 from images import WikiImages
 
 class TeeOutput:
-    """Write to both original output and string buffer"""
-    def __init__(self, original, buffer):
+    """
+    Process-wide stderr replacement that writes to the original stream and also
+    copies writes made on a capturing worker thread into that thread's buffer.
+    """
+    def __init__(self, original):
         self.original = original
-        self.buffer = buffer
-    
+        self._buffers = {}  # thread ident -> capture buffer
+
     def write(self, text):
         self.original.write(text)
-        self.original.flush()
-        self.buffer.write(text)
-    
+        buffer = self._buffers.get(threading.get_ident())
+        if buffer is not None:
+            buffer.write(text)
+        return len(text)
+
     def flush(self):
         self.original.flush()
-        self.buffer.flush()
+
+    def __getattr__(self, name):
+        return getattr(self.original, name)
+
+    @contextmanager
+    def capture(self, buffer):
+        """Copy everything the current thread writes into `buffer`."""
+        ident = threading.get_ident()
+        self._buffers[ident] = buffer
+        try:
+            yield buffer
+        finally:
+            self._buffers.pop(ident, None)
+
+# Installed once at import; redirect_stderr() is process-global and unsafe to nest
+# across overlapping uploads, so workers opt in per thread via run_captured().
+sys.stderr = tee_stderr = TeeOutput(sys.stderr)
+
+# Event-loop side logging goes through a queue so a single listener thread does the
+# stream writes. Worker threads keep using print(): their stderr is what run_captured
+# collects for the Discord error previews.
+logger = logging.getLogger("wiki-upload")
+logger.setLevel(logging.INFO)
+logger.propagate = False
+_log_queue = queue.SimpleQueue()
+logger.addHandler(logging.handlers.QueueHandler(_log_queue))
+_log_listener = logging.handlers.QueueListener(_log_queue, logging.StreamHandler(sys.stdout))
+_log_listener.start()
+atexit.register(_log_listener.stop)
+
+def run_captured(func, stderr_buffer):
+    """
+    Run func on the current (worker) thread, teeing its stderr into stderr_buffer.
+    Its stdout is not captured and only reaches the console.
+    """
+    with tee_stderr.capture(stderr_buffer):
+        return func()
+
+class HeadBuffer:
+    """Text sink that only keeps the first `limit` characters written"""
+    def __init__(self, limit=4096):
+        self.limit = limit
+        self._chunks = []
+        self._size = 0
+
+    def write(self, text):
+        if self._size < self.limit:
+            text_part = text[:self.limit - self._size]
+            self._chunks.append(text_part)
+            self._size += len(text_part)
+        return len(text)
+
+    def flush(self):
+        pass
+
+    def getvalue(self):
+        return "".join(self._chunks)
+
+class ProgressSignal:
+    """Wakes a progress updater when its upload worker reports a status change"""
+    def __init__(self):
+        self._loop = asyncio.get_running_loop()
+        self._event = asyncio.Event()
+
+    def notify(self):
+        """Safe to call from worker threads."""
+        self._loop.call_soon_threadsafe(self._event.set)
+
+    async def wait(self) -> bool:
+        """
+        Wait for the next status change, coalescing bursts into one wakeup per
+        PROGRESS_MIN_INTERVAL and falling back to a PROGRESS_HEARTBEAT tick.
+        Returns True if woken by a status change, False on a heartbeat tick.
+        """
+        await asyncio.sleep(PROGRESS_MIN_INTERVAL)
+        try:
+            await asyncio.wait_for(
+                self._event.wait(), timeout=PROGRESS_HEARTBEAT - PROGRESS_MIN_INTERVAL
+            )
+            notified = True
+        except asyncio.TimeoutError:
+            notified = False
+        self._event.clear()
+        return notified
+
+async def stop_updater(task: asyncio.Task):
+    """
+    Cancel a progress updater task and wait for it to finish unwinding. A failed
+    progress edit must not turn into a failed upload, so its errors are dropped too.
+    """
+    task.cancel()
+    try:
+        await task
+    except asyncio.CancelledError:
+        # Only swallow the updater's own cancellation; if this command was cancelled
+        # while waiting, keep propagating it.
+        current = asyncio.current_task()
+        if current is not None and current.cancelling():
+            raise
+    except Exception:
+        pass
+
+class _DryRunPageSave:
+    """Stand-in for Page.save in dry-run mode; the log prefix is rendered once per page"""
+    __slots__ = ("prefix",)
+
+    def __init__(self, page_name):
+        self.prefix = f"[DRY RUN] Would save page '{page_name}' with summary: '"
+
+    def __call__(self, text, summary='', **kwargs):
+        print(self.prefix + summary + "'")
 
 class DryRunWikiImages(WikiImages):
     """wrapper for dryrun"""
@@ -44,17 +170,71 @@ class DryRunWikiImages(WikiImages):
     
     def _dry_run_allimages(self, **kwargs):
         """Simulate allimages query without actually querying"""
-        print(f"[DRY RUN] Would query allimages with: {list(kwargs.keys())}")
-        return []  # Return empty list to simulate no duplicates found
+        print(f"[DRY RUN] Would query allimages with: {', '.join(kwargs)}")
+        return iter(())  # Empty result to simulate no duplicates found
     
     def _patch_page_save(self, page):
         """Patch a page's save method to be dry-run"""
         if not hasattr(page, '_original_save'):
             page._original_save = page.save
-            page.save = lambda text, summary='', **kwargs: print(f"[DRY RUN] Would save page '{page.name}' with summary: '{summary}'")
+            page.save = _DryRunPageSave(page.name)
 
-upload_lock = asyncio.Lock() # Global lock so only one upload runs at a time
-last_used = {}  # maps user_id -> timestamp of last command
+_wiki_clients = threading.local()
+WIKI_CLIENT_MAX_AGE = 30 * 60  # seconds a cached wiki login is reused before logging in again
+
+def get_wiki_client() -> WikiImages:
+    """
+    Return a logged-in WikiImages (DryRunWikiImages in dry-run mode) for the
+    calling worker thread, creating it on first use so later uploads skip the login.
+    Clients are per-thread so concurrent uploads never share status callbacks.
+    """
+    wi = getattr(_wiki_clients, "client", None)
+    now = time.monotonic()
+    # Log in again before an idle session is likely to have expired server-side.
+    if wi is None or now - _wiki_clients.created_at >= WIKI_CLIENT_MAX_AGE:
+        wi = DryRunWikiImages() if DRY_RUN else WikiImages()
+        _wiki_clients.client = wi
+        _wiki_clients.created_at = now
+    # Drop the previous run's callback so it cannot write into a stale status dict.
+    wi.__dict__.pop("_status_callback", None)
+    return wi
+
+# MediaWiki error codes meaning the cached client's login session is gone
+WIKI_SESSION_ERROR_CODES = frozenset({"assertuserfailed", "assertbotfailed", "notloggedin", "badtoken"})
+
+def report_worker_error(exc: Exception):
+    """
+    Print a worker failure to the captured stderr. If the wiki session expired,
+    drop this thread's cached client so the next upload logs in again.
+    """
+    if isinstance(exc, APIError) and exc.code in WIKI_SESSION_ERROR_CODES:
+        _wiki_clients.client = None
+    print(f"Error: {exc}", file=sys.stderr)
+
+@dataclass(slots=True)
+class UploadStatus:
+    """Progress shared between an upload worker thread and its progress updater"""
+    stage: str = "starting"
+    banner_id: str = ""
+    processed: int = 0
+    uploaded: int = 0
+    failed: int = 0
+    total: int = 0
+    current_identifier: str | None = None
+    downloaded_files: dict[str, None] = field(default_factory=dict)  # insertion-ordered set
+    banner_duplicates: list[dict] = field(default_factory=list)
+
+    def apply(self, stage: str, **kwargs):
+        """Apply a WikiImages status callback payload, ignoring unknown keys."""
+        downloaded_file = kwargs.pop("downloaded_file", None)
+        if downloaded_file:
+            self.downloaded_files[downloaded_file] = None
+        self.stage = stage
+        for key, value in kwargs.items():
+            if key in self.__dataclass_fields__:
+                setattr(self, key, value)
+
+last_used: OrderedDict[int, float] = OrderedDict()  # user_id -> time.monotonic() of last command, oldest first
 
 # --- CONFIG ---
 COOLDOWN_SECONDS = 5
@@ -68,21 +248,34 @@ MAX_ENEMY_ID_LEN = 64
 MAX_CLASS_SKIN_ID_LEN = 64
 MAX_RATEUP_INPUT_LEN = 1000
 MAX_RISING_ROTATION_NOTES_LEN = 500
-PAGE_NAME_INVALID_PATTERN = re.compile(r"[#<>\[\]\{\}\|\x00-\x1F]")
-FILE_NAME_INVALID_PATTERN = re.compile(r"[#<>\[\]\{\}\|:\x00-\x1F]")
+PAGE_NAME_INVALID_CHARS = frozenset("#<>[]{}|" + "".join(map(chr, range(0x20))))
+FILE_NAME_INVALID_CHARS = PAGE_NAME_INVALID_CHARS | {":"}
 CONTROL_CHAR_PATTERN = re.compile(r"[\x00-\x1F]")
-VALID_ITEM_ID_REGEX = re.compile(r"^[\w\-]+$")
-VALID_STATUS_ID_REGEX = re.compile(r"^[A-Za-z0-9_]+#?$")
-VALID_BANNER_ID_REGEX = re.compile(r"^[A-Za-z0-9_]+$")
-VALID_EVENT_ID_REGEX = re.compile(r"^[a-z0-9_]+$")
-VALID_ENEMY_ID_REGEX = re.compile(r"^[0-9]+$")
-VALID_CLASS_SKIN_ID_REGEX = re.compile(r"^[0-9]+$")
+# VALID_* patterns are applied with fullmatch(), so they carry no ^/$ anchors.
+VALID_ITEM_ID_REGEX = re.compile(r"[\w\-]+", re.ASCII)
+VALID_STATUS_ID_REGEX = re.compile(r"[A-Za-z0-9_]+#?")
+VALID_BANNER_ID_REGEX = re.compile(r"[A-Za-z0-9_]+")
+VALID_EVENT_ID_REGEX = re.compile(r"[a-z0-9_]+")
 DISCORD_TOKEN = os.environ["DISCORD_TOKEN"]
 GUILD_ID = int(os.environ["GUILD_ID"])
 # Comma-separated list of allowed roles, e.g. "Wiki Editor,Wiki Admin"
-ALLOWED_ROLES = [r.strip() for r in os.getenv("ALLOWED_ROLES", "Wiki Editor,Wiki Admin,Wiki Discord Moderator,Verified Editor").split(",")]
+ALLOWED_ROLES = [r.strip() for r in os.getenv("ALLOWED_ROLES", "Wiki Editor,Wiki Admin,Wiki Discord Moderator,Verified Editor").split(",") if r.strip()]
+ALLOWED_ROLE_SET = frozenset(ALLOWED_ROLES)
+ALLOWED_ROLES_DENIED_MESSAGE = f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}"
 # Enable dry-run mode (no actual uploads, just logging)
 DRY_RUN = os.getenv("DRY_RUN", "false").lower() in ("true", "1", "yes")
+DRY_RUN_PREFIX = "[DRY RUN] " if DRY_RUN else ""
+# Max uploads allowed to run at once. Uploads share the wiki account and its edit pacing.
+UPLOAD_CONCURRENCY = max(1, int(os.getenv("UPLOAD_CONCURRENCY", "1")))
+upload_slots = asyncio.Semaphore(UPLOAD_CONCURRENCY)  # Bounds how many uploads run at once
+active_page_uploads: set[str] = set()  # normalize_page_title() keys of /imgupload pages currently being uploaded
+PROGRESS_MIN_INTERVAL = 15  # Never edit a progress message more often than this
+PROGRESS_HEARTBEAT = 60  # Refresh the elapsed time at least this often, even without progress
+# Worker threads for the event loop's default executor (blocking calls other than uploads)
+THREAD_POOL_SIZE = max(1, int(os.getenv("THREAD_POOL_SIZE", "16")))
+# Upload workers get their own pool, one thread per upload slot, so they never queue
+# behind other blocking calls and each thread's cached wiki login stays in use.
+UPLOAD_EXECUTOR = ThreadPoolExecutor(max_workers=UPLOAD_CONCURRENCY, thread_name_prefix="wiki-upload")
 
 # Valid page types. Choice names are shown in Discord; values are used by the dispatcher.
 PAGE_TYPE_CHOICES = [
@@ -113,9 +306,42 @@ PAGE_TYPE_CHOICES = [
     app_commands.Choice(name="artifact", value="artifact"),
 ]
 PAGE_TYPES = [choice.value for choice in PAGE_TYPE_CHOICES]
+# page_type -> (WikiImages method, *extra args after the page). `character_full` has no slash-command choice.
+PAGE_TYPE_HANDLERS: dict[str, tuple[str, ...]] = {
+    "character": ("check_character",),
+    "character_full": ("check_character_full",),
+    "character_fs_skin": ("check_character_fs_skin",),
+    "weapon": ("check_weapon",),
+    "summon": ("check_summon",),
+    "class": ("check_class",),
+    "class_skin": ("check_class_skin",),
+    "skin": ("check_skin",),
+    "npc": ("check_npc",),
+    "story_location": ("check_story_location",),
+    "profile_stickers": ("check_profile", "stickers"),
+    "profile_backgrounds": ("check_profile", "backgrounds"),
+    "profile_other_characters": ("check_profile", "other_characters"),
+    "profile_favorite_art": ("check_profile", "favorite_art"),
+    "profile_trophies": ("check_profile", "trophies"),
+    "profile_trinkets": ("check_profile", "trinkets"),
+    "profile_frames": ("check_profile", "frames"),
+    "profile_designs": ("check_profile", "designs"),
+    "item": ("upload_item_article_images",),
+    "artifact": ("check_artifact",),
+    "manatura": ("check_manatura",),
+    "shield": ("check_shield",),
+    "skill_icons": ("check_skill_icons",),
+    "bullet": ("check_bullet",),
+    "advyrnture_gear": ("check_advyrnture_gear",),
+    "advyrnture_pal": ("check_advyrnture_pal",),
+}
+# Handlers that also take the optional `filter` value as their last argument.
+FILTERED_PAGE_TYPE_METHODS = frozenset({"check_class_skin", "check_profile"})
 
 # Supported single-item upload types (CDN path segments)
 ITEM_TYPES = ["article", "normal", "recycling", "skillplus", "evolution", "lottery", "npcaugment", "set", "ticket", "campaign", "npcarousal", "memorial"]
+# Autocomplete suggestions are rebuilt on every keystroke; build the Choice objects once.
+ITEM_TYPE_CHOICES = [app_commands.Choice(name=it.title(), value=it) for it in ITEM_TYPES]
 
 EVENT_TEASER_ASSET_TYPE_CHOICES = [
     app_commands.Choice(name="notice", value="notice"),
@@ -128,7 +354,15 @@ EVENT_TEASER_ASSET_TYPE_CHOICES = [
     app_commands.Choice(name="raid_thumb_collab", value="raid_thumb_collab"),
     app_commands.Choice(name="raid_thumb_records", value="raid_thumb_records"),
 ]
-EVENT_TEASER_ASSET_TYPE_SET = {choice.value for choice in EVENT_TEASER_ASSET_TYPE_CHOICES}
+EVENT_TEASER_ASSET_TYPE_SET = frozenset(choice.value for choice in EVENT_TEASER_ASSET_TYPE_CHOICES)
+# Default max_index per asset type when /eventupload omits it; others use WikiImages.EVENT_BANNER_MAX_INDEX.
+EVENT_ASSET_DEFAULT_MAX_INDEX = {
+    "raid_thumb": 13,
+    "raid_thumb_collab": 14,
+    "raid_thumb_records": 5,
+    "top": 1,
+    "trailer_mp3": 1,
+}
 
 DRAW_MODE_CHOICES = [
     app_commands.Choice(name="single", value="single"),
@@ -136,8 +370,10 @@ DRAW_MODE_CHOICES = [
     app_commands.Choice(name="element-single", value="element-single"),
     app_commands.Choice(name="element-double", value="element-double"),
 ]
-DRAW_MODE_SET = {choice.value for choice in DRAW_MODE_CHOICES}
+DRAW_MODE_SET = frozenset(choice.value for choice in DRAW_MODE_CHOICES)
+DRAW_DOUBLE_MODES = frozenset({"double", "element-double"})
 DRAW_COMMON_END_TIMES = ["18:59", "11:59", "23:59"]
+DRAW_END_TIME_CHOICES = [app_commands.Choice(name=t, value=t) for t in DRAW_COMMON_END_TIMES]
 DRAW_ELEMENT_CHOICES = [
     app_commands.Choice(name="fire", value="fire"),
     app_commands.Choice(name="water", value="water"),
@@ -210,6 +446,11 @@ RISING_ROTATION_AUTOCOMPLETE_NAMES = [
     name for name in sorted(set(RISING_ROTATION_CHARACTER_NAMES), key=str.casefold)
     if name not in {"All Characters", "38 Characters"}
 ]
+# (lowercased name, Choice) pairs so autocomplete does not re-lower every name per keystroke
+RISING_ROTATION_AUTOCOMPLETE_CHOICES = [
+    (name.lower(), app_commands.Choice(name=name, value=name))
+    for name in RISING_ROTATION_AUTOCOMPLETE_NAMES
+]
 
 HELP_COMMAND_DETAILS = {
     "help": {
@@ -381,32 +622,46 @@ def normalize_item_type_input(raw_value: str | None) -> str:
     """
     return (raw_value or "").strip().lower()
 
+def normalize_page_title(title: str) -> str:
+    """
+    Fold a page title the way MediaWiki does: underscores are spaces, runs of
+    whitespace collapse, and the first letter is upper-cased.
+    """
+    title = " ".join(title.replace("_", " ").split())
+    return title[:1].upper() + title[1:]
+
+def wiki_page_url(title: str) -> str:
+    """Build a gbf.wiki URL for a page or `File:` title, percent-encoding unsafe characters."""
+    return "https://gbf.wiki/" + quote(title.replace(" ", "_"), safe="/:()'!,")
+
+RISING_ROTATION_PAGE_URL = wiki_page_url(RISING_ROTATION_PAGE)
+
 def chunk_text_for_discord(content: str, limit: int = 2000) -> list[str]:
     """Split content into Discord-safe chunks, preserving line breaks when possible."""
     if len(content) <= limit:
         return [content]
 
     chunks: list[str] = []
-    current = ""
-
-    for line in content.split("\n"):
-        candidate = line if not current else f"{current}\n{line}"
-        if len(candidate) <= limit:
-            current = candidate
-            continue
-
-        if current:
-            chunks.append(current)
-            current = ""
-
-        while len(line) > limit:
-            chunks.append(line[:limit])
-            line = line[limit:]
-
-        current = line
+    start = 0
+    end = len(content)
+
+    while True:
+        # Blank lines at the start of a chunk are dropped.
+        while start < end and content[start] == "\n":
+            start += 1
+        if end - start <= limit:
+            break
+        # Break at the last newline that keeps the chunk within the limit, dropping it.
+        newline = content.rfind("\n", start, start + limit + 1)
+        if newline == -1:
+            chunks.append(content[start:start + limit])
+            start += limit
+        else:
+            chunks.append(content[start:newline])
+            start = newline + 1
 
-    if current or not chunks:
-        chunks.append(current)
+    if start < end or not chunks:
+        chunks.append(content[start:])
 
     return chunks
 
@@ -448,6 +703,12 @@ async def edit_public_message(msg: discord.Message, content: str) -> discord.Mes
         await refreshed.edit(content=content)
         return refreshed
 
+async def send_error_details(interaction: discord.Interaction, stderr: str, limit: int = 500) -> None:
+    """Follow up with the first `limit` characters of a failed worker's stderr, if any."""
+    error_preview = stderr.lstrip()[:limit].rstrip()
+    if error_preview:
+        await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+
 async def edit_or_followup_long_message_ephemeral(
     msg: discord.Message, interaction: discord.Interaction, content: str
 ) -> None:
@@ -460,137 +721,142 @@ async def edit_or_followup_long_message_ephemeral(
 def normalize_help_command_input(raw_value: str | None) -> str:
     return (raw_value or "").strip().lower().lstrip("/")
 
-def validate_page_name(page_name: str) -> tuple[bool, str]:
+def consume_cooldown(user_id: int, command_name: str) -> str | None:
     """
-    Validate a wiki page name string.
-    Returns (is_valid, error_message). If valid, error_message is "".
+    Check and start the per-user command cooldown in one step.
+    Returns the user-facing error message, or None when the command may run.
+    """
+    now = time.monotonic()
+    remaining = COOLDOWN_SECONDS - (now - last_used.get(user_id, float("-inf")))
+    if remaining > 0:
+        return f"Please wait {int(remaining)}s before using `/{command_name}` again."
+    last_used[user_id] = now
+    last_used.move_to_end(user_id)
+    # Oldest entries sit at the front; once past their cooldown they can never block anyone again.
+    while now - next(iter(last_used.values())) >= COOLDOWN_SECONDS:
+        last_used.popitem(last=False)
+    return None
+
+def page_name_chars_allowed(value: str) -> bool:
+    return PAGE_NAME_INVALID_CHARS.isdisjoint(value)
+
+def file_name_chars_allowed(value: str) -> bool:
+    return FILE_NAME_INVALID_CHARS.isdisjoint(value)
+
+def is_ascii_digits(value: str) -> bool:
+    # isdigit() alone also accepts non-ASCII digits such as full-width numerals
+    return value.isascii() and value.isdigit()
+
+def _validate(
+    value: str | None,
+    max_len: int,
+    label: str,
+    is_allowed: Callable[[str], object],
+    rule: str,
+    *,
+    unit: str = "characters",
+) -> tuple[bool, str]:
+    """
+    Shared strip + length + character check behind the single-value validators.
+    `is_allowed` gets the stripped value and returns a truthy result when its characters are valid.
+    Returns (is_valid, cleaned_value/error_message).
     """
-    page_name = page_name.strip()
+    value = (value or "").strip()
+
+    if not 0 < len(value) <= max_len:
+        return False, f"Invalid {label}. Must be between 1 and {max_len} {unit}."
 
-    # Length check
-    if len(page_name) == 0 or len(page_name) > MAX_PAGE_NAME_LEN:
-        return False, f"❌ Invalid page name. Must be between 1 and {MAX_PAGE_NAME_LEN} characters."
+    if not is_allowed(value):
+        return False, f"Invalid {label}. {rule}"
 
-    # Character check
-    if PAGE_NAME_INVALID_PATTERN.search(page_name):
-        return False, "❌ Invalid page name. Characters #, <, >, [, ], {, }, |, or control characters are not allowed."
+    return True, value
 
-    return True, page_name
+@lru_cache(maxsize=256)
+def validate_page_name(page_name: str) -> tuple[bool, str]:
+    """
+    Validate a wiki page name string.
+    Returns (is_valid, error_message). If valid, error_message is "".
+    """
+    is_valid, result = _validate(
+        page_name, MAX_PAGE_NAME_LEN, "page name", page_name_chars_allowed,
+        "Characters #, <, >, [, ], {, }, |, or control characters are not allowed.",
+    )
+    return is_valid, result if is_valid else f"❌ {result}"
 
 def validate_item_id(item_id: str) -> tuple[bool, str]:
     """
     Validate a single item upload id.
     Returns (is_valid, cleaned_value/err_message).
     """
-    item_id = item_id.strip()
-
-    if len(item_id) == 0 or len(item_id) > MAX_ITEM_ID_LEN:
-        return False, f"Invalid item id. Must be between 1 and {MAX_ITEM_ID_LEN} characters."
-
-    if not VALID_ITEM_ID_REGEX.match(item_id):
-        return False, "Invalid item id. Only letters, numbers, _, and - are allowed."
-
-    return True, item_id
+    return _validate(
+        item_id, MAX_ITEM_ID_LEN, "item id", VALID_ITEM_ID_REGEX.fullmatch,
+        "Only letters, numbers, _, and - are allowed.",
+    )
 
 def validate_item_name(item_name: str) -> tuple[bool, str]:
     """
     Validate a single item display name.
     Returns (is_valid, cleaned_value/err_message).
     """
-    item_name = item_name.strip()
-
-    if len(item_name) == 0 or len(item_name) > MAX_ITEM_NAME_LEN:
-        return False, f"Invalid item name. Must be between 1 and {MAX_ITEM_NAME_LEN} characters."
-
-    if PAGE_NAME_INVALID_PATTERN.search(item_name):
-        return False, "Invalid item name. Characters #, <, >, [, ], {, }, |, or control characters are not allowed."
-
-    return True, item_name
+    return _validate(
+        item_name, MAX_ITEM_NAME_LEN, "item name", page_name_chars_allowed,
+        "Characters #, <, >, [, ], {, }, |, or control characters are not allowed.",
+    )
 
 def validate_event_file_name(event_name: str) -> tuple[bool, str]:
     """
     Validate an event display name used for wiki file redirects.
     Returns (is_valid, cleaned_value/error_message).
     """
-    event_name = event_name.strip()
-
-    if len(event_name) == 0 or len(event_name) > MAX_ITEM_NAME_LEN:
-        return False, f"Invalid event name. Must be between 1 and {MAX_ITEM_NAME_LEN} characters."
-
-    if FILE_NAME_INVALID_PATTERN.search(event_name):
-        return False, "Invalid event name. Characters #, <, >, [, ], {, }, |, :, or control characters are not allowed."
-
-    return True, event_name
+    return _validate(
+        event_name, MAX_ITEM_NAME_LEN, "event name", file_name_chars_allowed,
+        "Characters #, <, >, [, ], {, }, |, :, or control characters are not allowed.",
+    )
 
 def validate_event_id(event_id: str) -> tuple[bool, str]:
     """
     Validate an event identifier used for CDN folder resolution.
     """
-    event_id = (event_id or "").strip().lower()
-
-    if len(event_id) == 0 or len(event_id) > MAX_EVENT_ID_LEN:
-        return False, f"Invalid event id. Must be between 1 and {MAX_EVENT_ID_LEN} characters."
-
-    if not VALID_EVENT_ID_REGEX.match(event_id):
-        return False, "Invalid event id. Only lowercase letters, numbers, and underscores are allowed."
-
-    return True, event_id
+    return _validate(
+        (event_id or "").lower(), MAX_EVENT_ID_LEN, "event id", VALID_EVENT_ID_REGEX.fullmatch,
+        "Only lowercase letters, numbers, and underscores are allowed.",
+    )
 
 def validate_status_id(status_id: str) -> tuple[bool, str]:
     """
     Validate a status icon identifier.
     Returns (is_valid, cleaned_value/error_message).
     """
-    status_id = status_id.strip()
-
-    if len(status_id) == 0 or len(status_id) > MAX_STATUS_ID_LEN:
-        return False, f"Invalid status id. Must be between 1 and {MAX_STATUS_ID_LEN} characters."
-
-    if not VALID_STATUS_ID_REGEX.match(status_id):
-        return False, "Invalid status id. Only letters, numbers, underscores, and an optional trailing # are allowed."
-
-    return True, status_id
+    return _validate(
+        status_id, MAX_STATUS_ID_LEN, "status id", VALID_STATUS_ID_REGEX.fullmatch,
+        "Only letters, numbers, underscores, and an optional trailing # are allowed.",
+    )
 
 def validate_enemy_id(enemy_id: str) -> tuple[bool, str]:
     """
     Validate an enemy id for the enemy upload command.
     """
-    enemy_id = (enemy_id or "").strip()
-
-    if len(enemy_id) == 0 or len(enemy_id) > MAX_ENEMY_ID_LEN:
-        return False, f"Invalid enemy id. Must be between 1 and {MAX_ENEMY_ID_LEN} digits."
-
-    if not VALID_ENEMY_ID_REGEX.match(enemy_id):
-        return False, "Invalid enemy id. Only digits are allowed."
-
-    return True, enemy_id
+    return _validate(
+        enemy_id, MAX_ENEMY_ID_LEN, "enemy id", is_ascii_digits,
+        "Only digits are allowed.", unit="digits",
+    )
 
 def validate_class_skin_filter(filter_value: str) -> tuple[bool, str]:
     """Validate the ClassSkin filter id input."""
-    filter_value = (filter_value or "").strip()
-
-    if len(filter_value) == 0 or len(filter_value) > MAX_CLASS_SKIN_ID_LEN:
-        return False, f"Invalid filter id. Must be between 1 and {MAX_CLASS_SKIN_ID_LEN} digits."
-
-    if not VALID_CLASS_SKIN_ID_REGEX.match(filter_value):
-        return False, "Invalid filter id. Only digits are allowed."
-
-    return True, filter_value
+    return _validate(
+        filter_value, MAX_CLASS_SKIN_ID_LEN, "filter id", is_ascii_digits,
+        "Only digits are allowed.", unit="digits",
+    )
 
 def validate_profile_filter(filter_value: str) -> tuple[bool, str]:
     """Validate a Profile Room row id filter input."""
-    filter_value = (filter_value or "").strip()
-
-    if filter_value.lower() == "all":
+    if (filter_value or "").strip().lower() == "all":
         return True, ""
 
-    if len(filter_value) == 0 or len(filter_value) > MAX_ITEM_ID_LEN:
-        return False, f"Invalid profile filter id. Must be between 1 and {MAX_ITEM_ID_LEN} characters."
-
-    if not VALID_ITEM_ID_REGEX.match(filter_value):
-        return False, "Invalid profile filter id. Only letters, numbers, underscores, and hyphens are allowed."
-
-    return True, filter_value
+    return _validate(
+        filter_value, MAX_ITEM_ID_LEN, "profile filter id", VALID_ITEM_ID_REGEX.fullmatch,
+        "Only letters, numbers, underscores, and hyphens are allowed.",
+    )
 
 def normalize_banner_id_input(raw_value: str | None) -> str:
     """
@@ -621,15 +887,23 @@ def validate_banner_id(banner_id: str) -> tuple[bool, str]:
     Validate a gacha banner identifier (portion between `banner_` and the index).
     Returns (is_valid, cleaned_value/error_message).
     """
-    banner_id = normalize_banner_id_input(banner_id)
+    return _validate(
+        normalize_banner_id_input(banner_id), MAX_BANNER_ID_LEN, "banner id", VALID_BANNER_ID_REGEX.fullmatch,
+        "Only letters, numbers, and underscores are allowed.",
+    )
 
-    if len(banner_id) == 0 or len(banner_id) > MAX_BANNER_ID_LEN:
-        return False, f"Invalid banner id. Must be between 1 and {MAX_BANNER_ID_LEN} characters."
+def parse_draw_date(date_text: str) -> datetime:
+    """Parse a YYYY-MM-DD date; like strptime, month and day may omit the leading zero."""
+    return datetime.strptime(date_text, "%Y-%m-%d")
 
-    if not VALID_BANNER_ID_REGEX.match(banner_id):
-        return False, "Invalid banner id. Only letters, numbers, and underscores are allowed."
+def parse_draw_time(time_text: str) -> tuple[int, int]:
+    """Parse an HH:MM 24-hour time into (hour, minute); the leading zeros are optional."""
+    parsed = datetime.strptime(time_text, "%H:%M")
+    return parsed.hour, parsed.minute
 
-    return True, banner_id
+def parse_draw_datetime(datetime_text: str) -> datetime:
+    """Parse a "YYYY-MM-DD HH:MM" string built from validated date and time inputs."""
+    return datetime.strptime(datetime_text, "%Y-%m-%d %H:%M")
 
 def validate_draw_end_date(end_date: str) -> tuple[bool, str]:
     """
@@ -637,7 +911,7 @@ def validate_draw_end_date(end_date: str) -> tuple[bool, str]:
     """
     cleaned = (end_date or "").strip()
     try:
-        datetime.strptime(cleaned, "%Y-%m-%d")
+        parse_draw_date(cleaned)
     except ValueError:
         return False, "Invalid end_date. Use YYYY-MM-DD in JST, e.g. 2026-03-01."
     return True, cleaned
@@ -648,7 +922,7 @@ def validate_draw_end_time(end_time: str) -> tuple[bool, str]:
     """
     cleaned = (end_time or "").strip()
     try:
-        datetime.strptime(cleaned, "%H:%M")
+        parse_draw_time(cleaned)
     except ValueError:
         return False, "Invalid end_time. Use HH:MM (24-hour), e.g. 18:59."
     return True, cleaned
@@ -731,12 +1005,10 @@ def validate_draw_link_target(link_target: str) -> tuple[bool, str]:
     """
     Validate the wiki link target used in generated File links.
     """
-    cleaned = (link_target or "").strip()
-    if len(cleaned) == 0 or len(cleaned) > MAX_PAGE_NAME_LEN:
-        return False, f"Invalid link target. Must be between 1 and {MAX_PAGE_NAME_LEN} characters."
-    if PAGE_NAME_INVALID_PATTERN.search(cleaned):
-        return False, "Invalid link target. Characters #, <, >, [, ], {, }, |, or control characters are not allowed."
-    return True, cleaned
+    return _validate(
+        link_target, MAX_PAGE_NAME_LEN, "link target", page_name_chars_allowed,
+        "Characters #, <, >, [, ], {, }, |, or control characters are not allowed.",
+    )
 
 def validate_pipe_separated_page_names(
     raw_value: str | None,
@@ -835,7 +1107,20 @@ def build_suptix_promo_content(promo_id: str, end_datetime_text: str, link_targe
     ])
 
 def _format_jst_datetime(dt: datetime) -> str:
-    return dt.strftime("%Y-%m-%d %H:%M JST")
+    # Same output as strftime("%Y-%m-%d %H:%M JST") without re-parsing a format string
+    return f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d} JST"
+
+def _build_day_pairs(files: list[str], day_count: int) -> list[list[str]]:
+    """
+    Pair banners per element day: (1,2), (3,4), ... An odd tail repeats its last banner,
+    and days past the end reuse the final banner twice.
+    """
+    last = files[-1]
+    pairs = [files[index:index + 2] for index in range(0, len(files), 2)]
+    if len(pairs[-1]) == 1:
+        pairs[-1].append(last)
+    pairs.extend([last, last] for _ in range(day_count - len(pairs)))
+    return pairs
 
 def build_draw_element_mode_content(
     left_files: list[str],
@@ -868,13 +1153,6 @@ def build_draw_element_mode_content(
     def pair_count(files: list[str]) -> int:
         return (len(files) + 1) // 2
 
-    def pair_for_day(files: list[str], day_index: int) -> list[str]:
-        first_index = day_index * 2
-        if first_index >= len(files):
-            return [files[-1], files[-1]]
-        second_index = min(first_index + 1, len(files) - 1)
-        return [files[first_index], files[second_index]]
-
     left_days = pair_count(left_files)
     right_days = pair_count(right_files) if right_files else 0
     element_count = max(left_days, right_days if is_double else 0)
@@ -883,18 +1161,26 @@ def build_draw_element_mode_content(
     slot_starts = [first_start + timedelta(days=i) for i in range(element_count)]
     slot_ends = [start + timedelta(days=1) - timedelta(minutes=1) for start in slot_starts]
 
+    left_pairs = _build_day_pairs(left_files, element_count)
+    right_pairs = _build_day_pairs(right_files, element_count) if is_double else None
+
     start_index = DRAW_ELEMENT_ORDER.index(start_element)
     ordered_elements = [
         DRAW_ELEMENT_ORDER[(start_index + idx) % len(DRAW_ELEMENT_ORDER)]
         for idx in range(element_count)
     ]
 
+    # Each slot's JST bounds are shared by the banner and icon schedules.
+    start_texts = [_format_jst_datetime(start) for start in slot_starts]
+    end_texts = [_format_jst_datetime(end) for end in slot_ends]
+
     # Banner content: initial day always visible, then swap daily with ScheduledContent.
-    day_contents: list[str] = []
+    # Every day is wrapped in ScheduledContent to prevent overlaps.
+    banner_lines: list[str] = []
     for idx in range(element_count):
-        left_pair = pair_for_day(left_files, idx)
+        left_pair = left_pairs[idx]
         if is_double:
-            right_pair = pair_for_day(right_files, idx)
+            right_pair = right_pairs[idx]
             day_content = (
                 '<div style="max-width: 230px; width:100%;">\n'
                 f'{build_draw_gallery_swap_images(left_pair, link_target)}\n'
@@ -905,27 +1191,22 @@ def build_draw_element_mode_content(
             )
         else:
             day_content = build_draw_gallery_swap_images(left_pair, link_target)
-        day_contents.append(day_content)
 
-    # Every day is wrapped in ScheduledContent to prevent overlaps.
-    banner_lines: list[str] = []
-    for idx in range(element_count):
-        start_text = _format_jst_datetime(slot_starts[idx])
-        end_text = _format_jst_datetime(slot_ends[idx])
+        end_text = end_texts[idx]
         if idx == element_count - 1:
             end_text = f"{end_text} + 3 days"
         banner_lines.append(
             "{{ScheduledContent|"
-            + f"{start_text}|{end_text}|content={day_contents[idx]}"
+            + f"{start_texts[idx]}|{end_text}|content={day_content}"
             + "}}"
         )
 
     # Icon content: active element at 36px, others at 20px.
     icon_lines = ["Element changes every day as follows:<br />"]
     for idx, element in enumerate(ordered_elements):
-        start_text = _format_jst_datetime(slot_starts[idx])
+        start_text = start_texts[idx]
         if idx < element_count - 1:
-            end_text = _format_jst_datetime(slot_ends[idx])
+            end_text = end_texts[idx]
             scheduled_size = f"{{{{ScheduledContent|{start_text}|{end_text}|36|20}}}}"
             icon_lines.append(f"{{{{Icon|{element}|size={scheduled_size}}}}}")
         else:
@@ -942,46 +1223,63 @@ def build_draw_element_mode_content(
         )
     return banner_text, "\n".join(icon_lines)
 
+# MediaWiki's per-query title limit for non-bot accounts
+MAX_TITLES_PER_QUERY = 50
+
+def _files_exist_bulk(site, file_names: list[str]) -> dict[str, bool]:
+    """
+    Check which file titles exist or redirect to a real file page with imageinfo,
+    using one query per MAX_TITLES_PER_QUERY names.
+    """
+    exists: dict[str, bool] = {}
+    for start in range(0, len(file_names), MAX_TITLES_PER_QUERY):
+        batch = file_names[start:start + MAX_TITLES_PER_QUERY]
+        result = site.api(
+            "query",
+            titles="|".join(f"File:{file_name}" for file_name in batch),
+            redirects=1,
+            prop="info|imageinfo",
+            iiprop="timestamp",
+        )
+        query = result.get("query", {})
+        # Follow each requested title through title normalization and redirects.
+        normalized = {entry["from"]: entry["to"] for entry in query.get("normalized", [])}
+        redirects = {entry["from"]: entry["to"] for entry in query.get("redirects", [])}
+        file_pages = {
+            page.get("title"): "missing" not in page and bool(page.get("imageinfo"))
+            for page in query.get("pages", {}).values()
+        }
+        for file_name in batch:
+            title = f"File:{file_name}"
+            title = normalized.get(title, title)
+            title = redirects.get(title, title)
+            exists[file_name] = file_pages.get(title, False)
+    return exists
+
 def _file_exists_or_redirects_to_file(site, file_name: str) -> bool:
     """
     Check if a file title exists or redirects to a real file page with imageinfo.
     """
-    title = f"File:{file_name}"
-    result = site.api(
-        "query",
-        titles=title,
-        redirects=1,
-        prop="info|imageinfo",
-        iiprop="timestamp",
-    )
-    pages = result.get("query", {}).get("pages", {})
-    if not pages:
-        return False
-
-    page = next(iter(pages.values()))
-    if "missing" in page:
-        return False
-    imageinfo = page.get("imageinfo")
-    return bool(imageinfo)
+    return _files_exist_bulk(site, [file_name])[file_name]
 
 def _resolve_draw_file_list(site, banner_id: str, count: int | None, max_probe: int) -> list[str]:
     """
     Resolve draw file list either by explicit count or probing until first miss.
+    All candidates are checked in batched queries, then scanned in index order.
     """
+    candidates = [
+        f"banner_{banner_id}_{index}.png"
+        for index in range(1, (count if count is not None else max_probe) + 1)
+    ]
+    exists = _files_exist_bulk(site, candidates)
+
     found_files: list[str] = []
-    if count is not None:
-        for index in range(1, count + 1):
-            file_name = f"banner_{banner_id}_{index}.png"
-            if not _file_exists_or_redirects_to_file(site, file_name):
+    for index, file_name in enumerate(candidates, start=1):
+        if not exists[file_name]:
+            if count is not None:
                 raise ValueError(
                     f'Missing banner at index {index} for "{banner_id}" while validating required contiguous range 1-{count}.'
                 )
-            found_files.append(file_name)
-        return found_files
-
-    for index in range(1, max_probe + 1):
-        file_name = f"banner_{banner_id}_{index}.png"
-        if not _file_exists_or_redirects_to_file(site, file_name):
             break
         found_files.append(file_name)
 
@@ -989,6 +1287,95 @@ def _resolve_draw_file_list(site, banner_id: str, count: int | None, max_probe:
         raise ValueError(f'No banners found for "{banner_id}" (missing banner_{banner_id}_1.png).')
     return found_files
 
+def _apply_status(
+    status: dict | UploadStatus | None,
+    progress: ProgressSignal | None,
+    stage: str,
+    **kwargs,
+) -> None:
+    """Record one WikiImages status tick into `status` and wake the progress updater."""
+    if isinstance(status, UploadStatus):
+        status.apply(stage, **kwargs)
+    elif status is not None:
+        downloaded_file = kwargs.pop("downloaded_file", None)
+        if downloaded_file:
+            status.setdefault("downloaded_files", {})[downloaded_file] = None
+        status["stage"] = stage
+        if kwargs:
+            status.update(kwargs)
+    if progress is not None:
+        progress.notify()
+
+def make_status_callback(
+    status: dict | UploadStatus | None,
+    progress: ProgressSignal | None = None,
+) -> Callable[..., None]:
+    """
+    Build a WikiImages-style `(stage, **kwargs)` status callback that records
+    into `status` and wakes the progress updater.
+    """
+    return partial(_apply_status, status, progress)
+
+async def run_worker_task(
+    task: Callable[[], int],
+    start_message: str,
+    failure_label: str,
+    dry_run_message: str = "DRY RUN MODE - No actual uploads will be performed",
+) -> tuple[int, str]:
+    """
+    Run task() in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
+    """
+    # Commands only ever show the first 500 characters of stderr
+    stderr_buffer = HeadBuffer()
+
+    try:
+        logger.info(start_message)
+        if DRY_RUN:
+            logger.info(dry_run_message)
+
+        return_code = await asyncio.get_running_loop().run_in_executor(
+            UPLOAD_EXECUTOR, run_captured, task, stderr_buffer
+        )
+
+        return return_code, stderr_buffer.getvalue()
+    except Exception as e:
+        logger.error("%s: %s", failure_label, e)
+        return 1, str(e)
+
+async def run_upload(
+    action: Callable[[WikiImages], dict | None],
+    start_message: str,
+    failure_label: str,
+    status: dict | UploadStatus | None = None,
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
+    """
+    Run action(wi) against the worker thread's WikiImages client with the status
+    callback wired up. A dict returned by the action is merged into status.
+    Returns (return_code, stderr)
+    """
+    update_status = make_status_callback(status, progress)
+
+    def upload_task():
+        try:
+            wi = get_wiki_client()
+            # Keep the Discord bot on its historical pacing. Local CLI runs use
+            # images.py env-driven safeguards, but the bot should stay at the
+            # established 5s delay so slash-command uploads do not become
+            # noticeably slower in normal operation.
+            wi.delay = 5
+            wi._status_callback = update_status
+
+            result = action(wi)
+            update_status("completed", **(result if isinstance(result, dict) else {}))
+            return 0
+        except Exception as e:
+            report_worker_error(e)
+            return 1
+
+    return await run_worker_task(upload_task, start_message, failure_label)
+
 async def run_draw_update(
     mode: str,
     end_datetime_text: str,
@@ -1000,27 +1387,23 @@ async def run_draw_update(
     link_target: str,
     element_start: str,
     status: dict | None = None,
-) -> tuple[int, str, str]:
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
-    Update MainPageDraw draw subtemplates in a thread and capture stdout/stderr.
-    Returns (return_code, stdout, stderr)
+    Update MainPageDraw draw subtemplates in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def update_status(stage: str, **kwargs):
-        if status is not None:
-            status.update({"stage": stage, **kwargs})
+    update_status = make_status_callback(status, progress)
 
     def upload_task():
         try:
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
+            wi = get_wiki_client()
             site = wi.wiki
 
             update_status("resolving_files")
             left_files = _resolve_draw_file_list(site, left_banner_id, left_count, max_probe)
             right_files: list[str] = []
-            if mode in ("double", "element-double") and right_banner_id:
+            if mode in DRAW_DOUBLE_MODES and right_banner_id:
                 right_files = _resolve_draw_file_list(site, right_banner_id, right_count, max_probe)
 
             page_updates: list[tuple[str, str]] = []
@@ -1036,7 +1419,7 @@ async def run_draw_update(
                     (DRAW_PAGE_DOUBLE_RIGHT, build_draw_gallery_swap_images(right_files, link_target))
                 )
             elif mode == "element-single":
-                end_datetime = datetime.strptime(end_datetime_text, "%Y-%m-%d %H:%M")
+                end_datetime = parse_draw_datetime(end_datetime_text)
                 element_banners, element_icons = build_draw_element_mode_content(
                     left_files,
                     end_datetime,
@@ -1046,7 +1429,7 @@ async def run_draw_update(
                 page_updates.append((DRAW_PAGE_ELEMENT_BANNERS, element_banners))
                 page_updates.append((DRAW_PAGE_ELEMENT_ICONS, element_icons))
             elif mode == "element-double":
-                end_datetime = datetime.strptime(end_datetime_text, "%Y-%m-%d %H:%M")
+                end_datetime = parse_draw_datetime(end_datetime_text)
                 element_banners, element_icons = build_draw_element_mode_content(
                     left_files,
                     end_datetime,
@@ -1094,49 +1477,35 @@ async def run_draw_update(
             )
             return 0
         except Exception as exc:
-            print(f"Error: {exc}", file=sys.stderr)
+            report_worker_error(exc)
             return 1
 
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(
+    return await run_worker_task(
+        upload_task,
+        (
             f"Starting draw update (mode: {mode}, left: {left_banner_id}, right: {right_banner_id}, "
             f"max_probe: {max_probe}, element_start: {element_start})"
-        )
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual saves will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as exc:
-        error_msg = f"Draw update task failed: {exc}"
-        print(error_msg)
-        return 1, "", str(exc)
+        ),
+        "Draw update task failed",
+        dry_run_message="DRY RUN MODE - No actual saves will be performed",
+    )
 
 async def run_rateup_update(
     end_datetime_text: str,
     rateup_names: list[str],
     sparkable_names: list[str],
     status: dict | None = None,
-) -> tuple[int, str, str]:
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
     Update MainPageDraw rate-up subtemplates in a thread.
-    Returns (return_code, stdout, stderr)
+    Returns (return_code, stderr)
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def update_status(stage: str, **kwargs):
-        if status is not None:
-            status.update({"stage": stage, **kwargs})
+    update_status = make_status_callback(status, progress)
 
     def upload_task():
         try:
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
+            wi = get_wiki_client()
             site = wi.wiki
 
             rateup_text = build_rateup_content(rateup_names, sparkable_names)
@@ -1170,28 +1539,18 @@ async def run_rateup_update(
             )
             return 0
         except Exception as exc:
-            print(f"Error: {exc}", file=sys.stderr)
+            report_worker_error(exc)
             return 1
 
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(
+    return await run_worker_task(
+        upload_task,
+        (
             f"Starting MainPageDraw rate-up update "
             f"(rateups: {len(rateup_names)}, sparkable: {len(sparkable_names)}, end: {end_datetime_text})"
-        )
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual saves will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as exc:
-        error_msg = f"Rate-up update task failed: {exc}"
-        print(error_msg)
-        return 1, "", str(exc)
+        ),
+        "Rate-up update task failed",
+        dry_run_message="DRY RUN MODE - No actual saves will be performed",
+    )
 
 async def run_promo_update(
     promo_type: str,
@@ -1199,20 +1558,16 @@ async def run_promo_update(
     end_datetime_text: str,
     link_target: str,
     status: dict | None = None,
-) -> tuple[int, str, str]:
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
     Update a supported MainPageDraw promo subtemplate without uploading assets.
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def update_status(stage: str, **kwargs):
-        if status is not None:
-            status.update({"stage": stage, **kwargs})
+    update_status = make_status_callback(status, progress)
 
     def upload_task():
         try:
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
+            wi = get_wiki_client()
             site = wi.wiki
 
             if promo_type == "suptix":
@@ -1269,27 +1624,17 @@ async def run_promo_update(
             )
             return 0
         except Exception as exc:
-            print(f"Error: {exc}", file=sys.stderr)
+            report_worker_error(exc)
             return 1
 
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(
+    return await run_worker_task(
+        upload_task,
+        (
             f"Starting promo update (type: {promo_type}, promo id: {promo_id}, end: {end_datetime_text})"
-        )
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual saves will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as exc:
-        error_msg = f"Promo update task failed: {exc}"
-        print(error_msg)
-        return 1, "", str(exc)
+        ),
+        "Promo update task failed",
+        dry_run_message="DRY RUN MODE - No actual saves will be performed",
+    )
 
 async def run_rising_rotation_update(
     start_datetime_text: str,
@@ -1298,20 +1643,16 @@ async def run_rising_rotation_update(
     notes: str,
     week_override: int | None,
     status: dict | None = None,
-) -> tuple[int, str, str]:
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
     Insert a new row into the GBVSR rotation page.
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def update_status(stage: str, **kwargs):
-        if status is not None:
-            status.update({"stage": stage, **kwargs})
+    update_status = make_status_callback(status, progress)
 
     def upload_task():
         try:
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
+            wi = get_wiki_client()
             site = wi.wiki
             page = site.pages[RISING_ROTATION_PAGE]
 
@@ -1381,200 +1722,82 @@ async def run_rising_rotation_update(
             )
             return 0
         except Exception as exc:
-            print(f"Error: {exc}", file=sys.stderr)
+            report_worker_error(exc)
             return 1
 
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(
+    return await run_worker_task(
+        upload_task,
+        (
             f"Starting GBVSR rotation update (start: {start_datetime_text}, end: {end_datetime_text}, "
             f"week_override: {week_override})"
-        )
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual saves will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as exc:
-        error_msg = f"Rising rotation update task failed: {exc}"
-        print(error_msg)
-        return 1, "", str(exc)
+        ),
+        "Rising rotation update task failed",
+        dry_run_message="DRY RUN MODE - No actual saves will be performed",
+    )
 
 async def run_wiki_upload(
     page_type: str,
     page_name: str,
     status: dict = None,
     filter_value: str | None = None,
-) -> tuple[int, str, str]:
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
-    Run wiki image upload in a thread and capture stdout/stderr.
-    Returns (return_code, stdout, stderr)
+    Run wiki image upload in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-    
-    def upload_task():
-        try:
-            if status:
-                status["stage"] = "initializing"
-                
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
-            # Keep the Discord bot on its historical pacing. Local CLI runs use
-            # images.py env-driven safeguards, but the bot should stay at the
-            # established 5s delay so slash-command uploads do not become
-            # noticeably slower in normal operation.
-            wi.delay = 5
-            
-            page = wi.wiki.pages[page_name]
-            
-            if DRY_RUN and hasattr(wi, '_patch_page_save'):
-                wi._patch_page_save(page)
-                
-            if status:
-                status["stage"] = "downloading"
-            
-            # Set status callback for progress updates
-            if status:
-                def update_status(stage, **kwargs):
-                    status.update({"stage": stage, **kwargs})
-                wi._status_callback = update_status
-            else:
-                wi._status_callback = lambda stage, **kwargs: None
-            
-            if page_type == 'character':
-                wi.check_character(page)
-            elif page_type == 'character_full':
-                wi.check_character_full(page)
-            elif page_type == 'character_fs_skin':
-                wi.check_character_fs_skin(page)
-            elif page_type == 'weapon':
-                wi.check_weapon(page)
-            elif page_type == 'summon':
-                wi.check_summon(page)
-            elif page_type == 'class':
-                wi.check_class(page)
-            elif page_type == 'class_skin':
-                if not filter_value:
-                    raise ValueError("class_skin uploads require a filter id")
-                wi.check_class_skin(page, filter_value)
-            elif page_type == 'skin':
-                wi.check_skin(page)
-            elif page_type == 'npc':
-                wi.check_npc(page)
-            elif page_type == 'story_location':
-                wi.check_story_location(page)
-            elif page_type == 'profile_stickers':
-                wi.check_profile(page, 'stickers', filter_value)
-            elif page_type == 'profile_backgrounds':
-                wi.check_profile(page, 'backgrounds', filter_value)
-            elif page_type == 'profile_other_characters':
-                wi.check_profile(page, 'other_characters', filter_value)
-            elif page_type == 'profile_favorite_art':
-                wi.check_profile(page, 'favorite_art', filter_value)
-            elif page_type == 'profile_trophies':
-                wi.check_profile(page, 'trophies', filter_value)
-            elif page_type == 'profile_trinkets':
-                wi.check_profile(page, 'trinkets', filter_value)
-            elif page_type == 'profile_frames':
-                wi.check_profile(page, 'frames', filter_value)
-            elif page_type == 'profile_designs':
-                wi.check_profile(page, 'designs', filter_value)
-            elif page_type == 'item':
-                wi.upload_item_article_images(page)
-            elif page_type == 'artifact':
-                wi.check_artifact(page)
-            elif page_type == 'manatura':
-                wi.check_manatura(page)
-            elif page_type == 'shield':
-                wi.check_shield(page)
-            elif page_type == 'skill_icons':
-                wi.check_skill_icons(page)
-            elif page_type == 'bullet':
-                wi.check_bullet(page)
-            elif page_type == 'advyrnture_gear':
-                wi.check_advyrnture_gear(page)
-            elif page_type == 'advyrnture_pal':
-                wi.check_advyrnture_pal(page)
-            else:
-                raise ValueError(f"Unknown page type: {page_type}")
-                
-            return 0
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
-    
-    try:
-        # Create tee outputs that write to both console and buffer
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-        
-        # Add some console logging
-        print(f"🚀 Starting upload task for {page_type}: {page_name}")
-        if DRY_RUN:
-            print("🧪 DRY RUN MODE - No actual uploads will be performed")
-        
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-        
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as e:
-        error_msg = f"❌ Upload task failed: {e}"
-        print(error_msg)
-        return 1, "", str(e)
+    if status:
+        status["stage"] = "initializing"
+
+    def upload_page_images(wi):
+        page = wi.wiki.pages[page_name]
+
+        if DRY_RUN and hasattr(wi, '_patch_page_save'):
+            wi._patch_page_save(page)
+
+        if status:
+            status["stage"] = "downloading"
+
+        handler = PAGE_TYPE_HANDLERS.get(page_type)
+        if handler is None:
+            raise ValueError(f"Unknown page type: {page_type}")
+        method_name, *args = handler
+        if method_name in FILTERED_PAGE_TYPE_METHODS:
+            if method_name == "check_class_skin" and not filter_value:
+                raise ValueError("class_skin uploads require a filter id")
+            args.append(filter_value)
+        getattr(wi, method_name)(page, *args)
+
+    return await run_upload(
+        upload_page_images,
+        f"🚀 Starting upload task for {page_type}: {page_name}",
+        "❌ Upload task failed",
+        status,
+        progress,
+    )
 
-async def run_item_upload(item_type: str, item_id: str, item_name: str, status: dict = None) -> tuple[int, str, str]:
+async def run_item_upload(
+    item_type: str,
+    item_id: str,
+    item_name: str,
+    status: dict = None,
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
-    Run single item image upload in a thread and capture stdout/stderr.
-    Returns (return_code, stdout, stderr)
+    Run single item image upload in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def upload_task():
-        try:
-            if status:
-                status["stage"] = "initializing"
-
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
-            wi.delay = 5
-
-            if status:
-                def update_status(stage, **kwargs):
-                    status.update({"stage": stage, **kwargs})
-                wi._status_callback = update_status
-            else:
-                wi._status_callback = lambda stage, **kwargs: None
-
-            if status:
-                status["item_type"] = item_type
-                status["stage"] = "processing"
-
-            wi.upload_single_item_images(item_type, item_id, item_name)
-            return 0
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
-
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(f"Starting single item upload for {item_name} (type: {item_type}, ID: {item_id})")
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual uploads will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as e:
-        error_msg = f"Single item upload task failed: {e}"
-        print(error_msg)
-        return 1, "", str(e)
+    if status:
+        status["item_type"] = item_type
+        status["stage"] = "processing"
+
+    return await run_upload(
+        lambda wi: wi.upload_single_item_images(item_type, item_id, item_name),
+        f"Starting single item upload for {item_name} (type: {item_type}, ID: {item_id})",
+        "Single item upload task failed",
+        status,
+        progress,
+    )
 
 async def run_event_upload(
     event_id: str,
@@ -1582,236 +1805,105 @@ async def run_event_upload(
     asset_type: str,
     max_index: int,
     status: dict | None = None,
-) -> tuple[int, str, str]:
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
-    Run event asset upload in a thread and capture stdout/stderr.
-    Returns (return_code, stdout, stderr)
+    Run event asset upload in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def upload_task():
-        try:
-            if status is not None:
-                status.setdefault("stage", "initializing")
-                status.setdefault("processed", 0)
-                status.setdefault("uploaded", 0)
-                status.setdefault("duplicates", 0)
-                status.setdefault("failed", 0)
-                status.setdefault("total_urls", 0)
-                status.setdefault("files", [])
-                status.setdefault("asset_type", asset_type)
-
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
-            wi.delay = 5
+    if status is not None:
+        status.setdefault("stage", "initializing")
+        status.setdefault("processed", 0)
+        status.setdefault("uploaded", 0)
+        status.setdefault("duplicates", 0)
+        status.setdefault("failed", 0)
+        status.setdefault("total_urls", 0)
+        status.setdefault("files", [])
+        status.setdefault("asset_type", asset_type)
+
+    return await run_upload(
+        lambda wi: wi.upload_event_assets(event_id, event_name, asset_type, max_index),
+        f"Starting event upload for {event_name} (event id: {event_id}, asset type: {asset_type})",
+        "Event upload task failed",
+        status,
+        progress,
+    )
 
-            if status is not None:
-                def update_status(stage, **kwargs):
-                    status.update({"stage": stage, **kwargs})
-                wi._status_callback = update_status
-            else:
-                wi._status_callback = lambda stage, **kwargs: None
+async def run_enemy_upload(
+    enemy_id: str,
+    status: dict | None = None,
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
+    """
+    Run enemy icon upload in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
+    """
+    if status is not None:
+        status.setdefault("stage", "initializing")
+        status.setdefault("processed", 0)
+        status.setdefault("uploaded", 0)
+        status.setdefault("duplicates", 0)
+        status.setdefault("failed", 0)
+        status.setdefault("total", 2)
+        status.setdefault("files", [])
+
+    return await run_upload(
+        lambda wi: wi.upload_enemy_images(enemy_id),
+        f"Starting enemy upload for id {enemy_id}",
+        "Enemy upload task failed",
+        status,
+        progress,
+    )
 
-            result = wi.upload_event_assets(event_id, event_name, asset_type, max_index)
-            if status is not None:
-                status.update(result)
-                status["stage"] = "completed"
-            return 0
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
+async def run_status_upload(
+    status_identifier: str,
+    max_index: int | None,
+    status: dict = None,
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
+    """
+    Run status icon upload in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
+    """
+    if status is not None:
+        status.setdefault("status_id", status_identifier)
+        status.setdefault("processed", 0)
+        status.setdefault("uploaded", 0)
+        status.setdefault("failed", 0)
+        status.setdefault("total", 1 if max_index is None else max_index + 1)
+        status.setdefault("downloaded_files", {})
+        status["stage"] = "initializing"
+
+    return await run_upload(
+        lambda wi: wi.upload_status_icons(status_identifier, max_index),
+        f"Starting status upload for {status_identifier} (max index: {max_index})",
+        "Status upload task failed",
+        status,
+        progress,
+    )
 
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(
-            f"Starting event upload for {event_name} (event id: {event_id}, asset type: {asset_type})"
-        )
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual uploads will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as e:
-        error_msg = f"Event upload task failed: {e}"
-        print(error_msg)
-        return 1, "", str(e)
-
-async def run_enemy_upload(enemy_id: str, status: dict | None = None) -> tuple[int, str, str]:
-    """
-    Run enemy icon upload in a thread and capture stdout/stderr.
-    Returns (return_code, stdout, stderr)
-    """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def upload_task():
-        try:
-            if status is not None:
-                status.setdefault("stage", "initializing")
-                status.setdefault("processed", 0)
-                status.setdefault("uploaded", 0)
-                status.setdefault("duplicates", 0)
-                status.setdefault("failed", 0)
-                status.setdefault("total", 2)
-                status.setdefault("files", [])
-
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
-            wi.delay = 5
-
-            if status is not None:
-                def update_status(stage, **kwargs):
-                    status.update({"stage": stage, **kwargs})
-                wi._status_callback = update_status
-            else:
-                wi._status_callback = lambda stage, **kwargs: None
-
-            result = wi.upload_enemy_images(enemy_id)
-            if status is not None:
-                status.update(result)
-                status["stage"] = "completed"
-            return 0
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
-
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(f"Starting enemy upload for id {enemy_id}")
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual uploads will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as e:
-        error_msg = f"Enemy upload task failed: {e}"
-        print(error_msg)
-        return 1, "", str(e)
-
-async def run_status_upload(status_identifier: str, max_index: int | None, status: dict = None) -> tuple[int, str, str]:
-    """
-    Run status icon upload in a thread and capture stdout/stderr.
-    Returns (return_code, stdout, stderr)
-    """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def upload_task():
-        try:
-            if status is not None:
-                status.setdefault("status_id", status_identifier)
-                status.setdefault("processed", 0)
-                status.setdefault("uploaded", 0)
-                status.setdefault("failed", 0)
-                status.setdefault("total", 1 if max_index is None else max_index + 1)
-                status.setdefault("downloaded_files", [])
-                status["stage"] = "initializing"
-
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
-            wi.delay = 5
-
-            if status is not None:
-                def update_status(stage, **kwargs):
-                    downloaded_file = kwargs.pop("downloaded_file", None)
-                    if downloaded_file:
-                        status.setdefault("downloaded_files", []).append(downloaded_file)
-                    status.update({"stage": stage, **kwargs})
-                wi._status_callback = update_status
-            else:
-                wi._status_callback = lambda stage, **kwargs: None
-
-            wi.upload_status_icons(status_identifier, max_index)
-
-            if status is not None and status.get("stage") != "completed":
-                status["stage"] = "completed"
-
-            return 0
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
-
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(f"Starting status upload for {status_identifier} (max index: {max_index})")
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual uploads will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as e:
-        error_msg = f"Status upload task failed: {e}"
-        print(error_msg)
-        return 1, "", str(e)
-
-async def run_banner_upload(banner_identifier: str, max_index: int, status: dict = None) -> tuple[int, str, str]:
+async def run_banner_upload(
+    banner_identifier: str,
+    max_index: int,
+    status: UploadStatus | None = None,
+    progress: ProgressSignal | None = None,
+) -> tuple[int, str]:
     """
-    Run gacha banner upload in a thread and capture stdout/stderr.
-    Returns (return_code, stdout, stderr)
+    Run gacha banner upload in a worker thread and capture its stderr.
+    Returns (return_code, stderr)
     """
-    stdout_buffer = io.StringIO()
-    stderr_buffer = io.StringIO()
-
-    def upload_task():
-        try:
-            if status is not None:
-                status.setdefault("banner_id", banner_identifier)
-                status.setdefault("processed", 0)
-                status.setdefault("uploaded", 0)
-                status.setdefault("failed", 0)
-                status.setdefault("total", max_index)
-                status.setdefault("downloaded_files", [])
-                status["stage"] = "initializing"
-
-            wi = DryRunWikiImages() if DRY_RUN else WikiImages()
-            wi.delay = 5
-
-            if status is not None:
-                def update_status(stage, **kwargs):
-                    downloaded_file = kwargs.pop("downloaded_file", None)
-                    if downloaded_file:
-                        status.setdefault("downloaded_files", []).append(downloaded_file)
-                    status.update({"stage": stage, **kwargs})
-                wi._status_callback = update_status
-            else:
-                wi._status_callback = lambda stage, **kwargs: None
-
-            wi.upload_gacha_banners(banner_identifier, max_index)
-
-            if status is not None and status.get("stage") != "completed":
-                status["stage"] = "completed"
-
-            return 0
-        except Exception as e:
-            print(f"Error: {e}", file=sys.stderr)
-            return 1
-
-    try:
-        tee_stdout = TeeOutput(sys.stdout, stdout_buffer)
-        tee_stderr = TeeOutput(sys.stderr, stderr_buffer)
-
-        print(f"Starting banner upload for {banner_identifier} (max index: {max_index})")
-        if DRY_RUN:
-            print("DRY RUN MODE - No actual uploads will be performed")
-
-        with redirect_stdout(tee_stdout), redirect_stderr(tee_stderr):
-            return_code = await asyncio.to_thread(upload_task)
-
-        return return_code, stdout_buffer.getvalue(), stderr_buffer.getvalue()
-    except Exception as e:
-        error_msg = f"Gacha banner upload task failed: {e}"
-        print(error_msg)
-        return 1, "", str(e)
+    if status is not None:
+        status.banner_id = status.banner_id or banner_identifier
+        status.total = status.total or max_index
+        status.stage = "initializing"
+
+    return await run_upload(
+        lambda wi: wi.upload_gacha_banners(banner_identifier, max_index),
+        f"Starting banner upload for {banner_identifier} (max index: {max_index})",
+        "Gacha banner upload task failed",
+        status,
+        progress,
+    )
 
 # --- BOT SETUP ---
 class WikiBot(discord.Client):
@@ -1819,20 +1911,43 @@ class WikiBot(discord.Client):
         intents = discord.Intents.default()
         intents.guilds = True
         intents.members = True
-        super().__init__(intents=intents)
+        # Status and summary messages echo user-supplied ids/names; never let them ping anyone.
+        super().__init__(intents=intents, allowed_mentions=discord.AllowedMentions.none())
         self.tree = app_commands.CommandTree(self)
         self._sync_lock: asyncio.Lock | None = None
         self._commands_synced = False
         self._last_sync_scope = "unsynced"
+        self._allowed_role_ids: dict[int, frozenset[int]] = {}
 
     async def setup_hook(self):
+        asyncio.get_running_loop().set_default_executor(
+            ThreadPoolExecutor(max_workers=THREAD_POOL_SIZE, thread_name_prefix="bot-io")
+        )
         await self.sync_app_commands(initial=True, force=True)
 
     async def on_ready(self):
-        print(f"Logged in as {self.user} (ID: {self.user.id})")
+        logger.info("Logged in as %s (ID: %s)", self.user, self.user.id)
         if not self._commands_synced:
             await self.sync_app_commands()
 
+    def allowed_role_ids(self, guild: discord.Guild) -> frozenset[int]:
+        """Resolve ALLOWED_ROLES names to role ids once per guild."""
+        role_ids = self._allowed_role_ids.get(guild.id)
+        if role_ids is None:
+            role_ids = frozenset(role.id for role in guild.roles if role.name in ALLOWED_ROLE_SET)
+            self._allowed_role_ids[guild.id] = role_ids
+        return role_ids
+
+    # Role names can change at any time, so drop the resolved ids whenever a guild's roles do.
+    async def on_guild_role_create(self, role: discord.Role):
+        self._allowed_role_ids.pop(role.guild.id, None)
+
+    async def on_guild_role_update(self, before: discord.Role, after: discord.Role):
+        self._allowed_role_ids.pop(after.guild.id, None)
+
+    async def on_guild_role_delete(self, role: discord.Role):
+        self._allowed_role_ids.pop(role.guild.id, None)
+
     async def sync_app_commands(self, *, initial: bool = False, force: bool = False) -> dict:
         if self._sync_lock is None:
             self._sync_lock = asyncio.Lock()
@@ -1856,7 +1971,7 @@ class WikiBot(discord.Client):
                 commands = await self.tree.sync(guild=guild)
                 self._commands_synced = True
                 self._last_sync_scope = "guild"
-                print(f"Synced {len(commands)} commands to guild {GUILD_ID}")
+                logger.info("Synced %d commands to guild %s", len(commands), GUILD_ID)
                 return {
                     "scope": "guild",
                     "count": len(commands),
@@ -1865,14 +1980,14 @@ class WikiBot(discord.Client):
                 }
             except Exception as exc:
                 last_error = exc
-                print(f"Guild slash-command sync failed: {exc}")
+                logger.error("Guild slash-command sync failed: %s", exc)
 
-            print("Attempting global slash-command sync fallback...")
+            logger.info("Attempting global slash-command sync fallback...")
             try:
                 commands = await self.tree.sync()
                 self._commands_synced = True
                 self._last_sync_scope = "global"
-                print(f"Fallback global sync succeeded with {len(commands)} commands")
+                logger.info("Fallback global sync succeeded with %d commands", len(commands))
                 return {
                     "scope": "global",
                     "count": len(commands),
@@ -1881,12 +1996,49 @@ class WikiBot(discord.Client):
                 }
             except Exception as final_exc:
                 self._commands_synced = False
-                print(f"Global slash-command sync failed: {final_exc}")
+                logger.error("Global slash-command sync failed: %s", final_exc)
                 raise
 
 
 bot = WikiBot()
 
+def interaction_member(interaction: discord.Interaction) -> discord.Member | None:
+    """Guild interactions already carry the Member; only fall back to the member cache otherwise."""
+    member = interaction.user
+    if isinstance(member, discord.Member):
+        return member
+    return interaction.guild.get_member(member.id) if interaction.guild else None
+
+class UploadAccessDenied(app_commands.CheckFailure):
+    """Raised by has_upload_access when the user holds none of the allowed roles."""
+
+def has_upload_access(interaction: discord.Interaction) -> bool:
+    """Allowed-role holders and the server owner may run upload-style commands."""
+    member = interaction_member(interaction)
+    if member is not None and (
+        member.guild.owner_id == member.id
+        or not bot.allowed_role_ids(member.guild).isdisjoint(role.id for role in member.roles)
+    ):
+        return True
+    raise UploadAccessDenied(ALLOWED_ROLES_DENIED_MESSAGE)
+
+@bot.tree.error
+async def on_app_command_error(interaction: discord.Interaction, error: app_commands.AppCommandError):
+    command_name = interaction.command.name if interaction.command else None
+    if isinstance(error, app_commands.CheckFailure):
+        if isinstance(error, UploadAccessDenied):
+            # /imgupload has always prefixed its denial with ❌
+            content = f"❌ {error}" if command_name == "imgupload" else str(error)
+        else:
+            logger.info("Check failed for command %r: %s", command_name, error)
+            content = "You cannot use this command right now."
+        if interaction.response.is_done():
+            await interaction.followup.send(content, ephemeral=True)
+        else:
+            await interaction.response.send_message(content, ephemeral=True)
+        return
+    logger.error("Ignoring exception in command %r", command_name, exc_info=error)
+
 
 # --- SLASH COMMAND ---
 from discord import app_commands
@@ -1895,7 +2047,7 @@ from discord import app_commands
     name="imgupload",
     description="Upload a page's images to the wiki",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)  # only allow your roles
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     page_type="Type of page",
     page_name="Wiki page name",
@@ -1909,17 +2061,6 @@ async def upload(
     page_name: str,
     page_filter: str | None = None,
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"❌ You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True
-        )
-        return
-    
     is_valid, result = validate_page_name(page_name)
     if not is_valid:
         await interaction.response.send_message(result, ephemeral=True)
@@ -1945,111 +2086,122 @@ async def upload(
         if upload_filter
         else page_name
     )
+    # Invariant part of every status message for this upload
+    upload_target = f"`{display_target}` ({page_type.value})"
 
     # Check cooldown
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"⚠️ You must wait {remaining}s before using `/upload` again.",
-            ephemeral=True
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "imgupload")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    # Ensure only one upload runs at a time
-    if upload_lock.locked():
+    # Reject instead of queueing when every upload slot is taken
+    if upload_slots.locked():
         await interaction.response.send_message(
             "⚠️ Another upload is already running. Please wait until it finishes.",
             ephemeral=True
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    # Two uploads of the same page would race on its MediaWiki state
+    page_key = normalize_page_title(page_name)
+    if page_key in active_page_uploads:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Upload started for `{display_target}` ({page_type.value}). This may take a while..."
+            f"⚠️ An upload for `{page_name}` is already running. Please wait until it finishes.",
+            ephemeral=True
         )
-        msg = await get_persistent_response_message(interaction)
+        return
 
+    active_page_uploads.add(page_key)
     try:
-        start_time = time.time()
+        async with upload_slots:
+            await interaction.response.send_message(
+                f"{DRY_RUN_PREFIX}Upload started for {upload_target}. This may take a while..."
+            )
+            msg = await get_persistent_response_message(interaction)
 
-        status = {"stage": "starting", "details": ""}
-        
-        # define updater function here
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
-                
-                if status["stage"] == "downloading":
-                    content = f"{dry_run_prefix}Downloading images for `{display_target}` ({page_type.value})... ({elapsed}s elapsed)"
-                elif status["stage"] == "processing":
+            try:
+                start_time = time.monotonic()
+
+                status = {"stage": "starting", "details": ""}
+            
+                # define updater function here
+                async def progress_updater():
+                    nonlocal msg
+                    while True:
+                        await progress.wait()
+                        elapsed = int(time.monotonic() - start_time)
+                    
+                        stage = status["stage"]
+                        if stage == "downloading":
+                            content = f"{DRY_RUN_PREFIX}Downloading images for {upload_target}... ({elapsed}s elapsed)"
+                        elif stage == "processing":
+                            processed = status.get("processed", 0)
+                            total = status.get("total", 0)
+                            current_image = status.get("current_image", "")
+                            content = f"{DRY_RUN_PREFIX}Processing {processed}/{total} images for {upload_target}. Current: {current_image} ({elapsed}s elapsed)"
+                        elif stage == "downloaded":
+                            successful = status.get("successful", 0)
+                            failed = status.get("failed", 0)
+                            content = f"{DRY_RUN_PREFIX}Downloaded {successful} images, {failed} failed for {upload_target}. Starting processing... ({elapsed}s elapsed)"
+                        else:
+                            content = f"{DRY_RUN_PREFIX}Upload for {upload_target} still running... ({elapsed}s elapsed)"
+                    
+                        msg = await edit_public_message(msg, content)
+
+                # start the updater task
+                progress = ProgressSignal()
+                updater_task = asyncio.create_task(progress_updater())
+                try:
+                    return_code, stderr = await run_wiki_upload(
+                        page_type.value,
+                        page_name,
+                        status,
+                        filter_value=upload_filter,
+                        progress=progress,
+                    )
+                finally:
+                    await stop_updater(updater_task)
+                elapsed = int(time.monotonic() - start_time)
+
+                if return_code == 0:
+                    # Create summary from final status
+                    downloaded = status.get("successful", 0)
                     processed = status.get("processed", 0)
-                    total = status.get("total", 0)
-                    current_image = status.get("current_image", "")
-                    content = f"{dry_run_prefix}Processing {processed}/{total} images for `{display_target}` ({page_type.value}). Current: {current_image} ({elapsed}s elapsed)"
-                elif status["stage"] == "downloaded":
-                    successful = status.get("successful", 0)
+                    uploaded = status.get("uploaded", 0)
+                    duplicates = status.get("duplicates", 0)
                     failed = status.get("failed", 0)
-                    content = f"{dry_run_prefix}Downloaded {successful} images, {failed} failed for `{display_target}` ({page_type.value}). Starting processing... ({elapsed}s elapsed)"
-                else:
-                    content = f"{dry_run_prefix}Upload for `{display_target}` ({page_type.value}) still running... ({elapsed}s elapsed)"
+                    total_checked = status.get("total_urls", 0)
                 
-                msg = await edit_public_message(msg, content)
-
-        # start the updater task
-        updater_task = asyncio.create_task(progress_updater())
-
-        return_code, stdout, stderr = await run_wiki_upload(
-            page_type.value,
-            page_name,
-            status,
-            filter_value=upload_filter,
-        )
-        
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            # Create summary from final status
-            downloaded = status.get("successful", 0)
-            processed = status.get("processed", 0)
-            uploaded = status.get("uploaded", 0)
-            duplicates = status.get("duplicates", 0)
-            failed = status.get("failed", 0)
-            total_checked = status.get("total_urls", 0)
-            
-            summary = f"{dry_run_prefix}Upload completed for `{display_target}` ({page_type.value}) in {elapsed}s!\n"
-            summary += f"**Summary:**\n"
-            summary += f"• Images downloaded: {downloaded}\n"
-            summary += f"• Images uploaded: {uploaded}\n"
-            summary += f"• Images found as duplicates: {duplicates}\n"
-            summary += f"• Images processed: {processed}\n" 
-            summary += f"• Download failures: {failed}\n"
-            summary += f"• Total URLs checked: {total_checked}"
-            
-            msg = await edit_public_message(msg, summary)
-        else:
-            msg = await edit_public_message(msg, f"{dry_run_prefix}Upload failed for `{display_target}` ({page_type.value}) in {elapsed}s!")
-            # Show error details in Discord if there were errors
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]  # First 500 chars
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                    summary = "\n".join([
+                        f"{DRY_RUN_PREFIX}Upload completed for {upload_target} in {elapsed}s!",
+                        "**Summary:**",
+                        f"• Images downloaded: {downloaded}",
+                        f"• Images uploaded: {uploaded}",
+                        f"• Images found as duplicates: {duplicates}",
+                        f"• Images processed: {processed}",
+                        f"• Download failures: {failed}",
+                        f"• Total URLs checked: {total_checked}",
+                    ])
+                
+                    msg = await edit_public_message(msg, summary)
+                else:
+                    msg = await edit_public_message(msg, f"{DRY_RUN_PREFIX}Upload failed for {upload_target} in {elapsed}s!")
+                    # Show error details in Discord if there were errors
+                    await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+            except Exception as e:
+                elapsed = int(time.monotonic() - start_time)
+                msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
+    finally:
+        active_page_uploads.discard(page_key)
 
 @bot.tree.command(
     name="statusupload",
     description="Upload status icon variants to the wiki",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     status_id="Status identifier (e.g. 1438, status_1438, 1438#)",
     max_index="Maximum index when using # (1-100, defaults to 10)",
@@ -2059,17 +2211,6 @@ async def statusupload(
     status_id: str,
     max_index: app_commands.Range[int, 1, 100] = 10,
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     is_valid_status, cleaned_status_id = validate_status_id(status_id)
     if not is_valid_status:
         await interaction.response.send_message(cleaned_status_id, ephemeral=True)
@@ -2079,127 +2220,129 @@ async def statusupload(
     max_index_value = max_index if ranged else None
     total_expected = (max_index_value + 1) if ranged else 1
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/statusupload` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "statusupload")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         range_text = f" (up to {max_index_value} icons)" if ranged else ""
         await interaction.response.send_message(
-            f"{dry_run_prefix}Status upload started for `{cleaned_status_id}`{range_text}. This may take a while..."
+            f"{DRY_RUN_PREFIX}Status upload started for `{cleaned_status_id}`{range_text}. This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status_info = {
-            "stage": "starting",
-            "status_id": cleaned_status_id,
-            "processed": 0,
-            "uploaded": 0,
-            "failed": 0,
-            "total": total_expected,
-            "downloaded_files": [],
-        }
+        try:
+            start_time = time.monotonic()
+            status_info = {
+                "stage": "starting",
+                "status_id": cleaned_status_id,
+                "processed": 0,
+                "uploaded": 0,
+                "failed": 0,
+                "total": total_expected,
+                "downloaded_files": {},
+            }
+
+            async def progress_updater():
+                nonlocal msg
+                last_rendered = None
+                while True:
+                    notified = await progress.wait()
+
+                    stage = status_info.get("stage", "processing")
+                    processed = status_info.get("processed", 0)
+                    total = status_info.get("total") or "?"
+                    current_identifier = status_info.get("current_identifier")
+
+                    # A status change that renders the same is not worth a Discord edit;
+                    # heartbeat ticks still go through to keep the elapsed time moving.
+                    rendered = (stage, processed, total, current_identifier)
+                    if notified and rendered == last_rendered:
+                        continue
+                    last_rendered = rendered
+                    elapsed = int(time.monotonic() - start_time)
+
+                    if stage == "processing":
+                        current_segment = (
+                            f" Current icon: `{current_identifier}`" if current_identifier else ""
+                        )
+                        content = (
+                            f"{DRY_RUN_PREFIX}Processing {processed}/{total} status icons "
+                            f"for `{cleaned_status_id}`.{current_segment} ({elapsed}s elapsed)"
+                        )
+                    elif stage == "completed":
+                        content = (
+                            f"{DRY_RUN_PREFIX}Status upload for `{cleaned_status_id}` "
+                            f"is wrapping up ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Status upload for `{cleaned_status_id}` "
+                            f"is {stage} ({elapsed}s elapsed)"
+                        )
 
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
+                    msg = await edit_public_message(msg, content)
 
-                stage = status_info.get("stage", "processing")
-                processed = status_info.get("processed", 0)
-                total = status_info.get("total") or "?"
-                current_identifier = status_info.get("current_identifier")
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_status_upload(
+                    cleaned_status_id, max_index_value, status_info, progress=progress
+                )
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
+
+            if return_code == 0:
+                processed = status_info.get("processed", total_expected)
+                uploaded = status_info.get("uploaded", 0)
+                failed = status_info.get("failed", 0)
+                downloaded_files = status_info.get("downloaded_files") or {}
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Status upload completed for `{cleaned_status_id}` in {elapsed}s!",
+                    "**Summary:**",
+                    f"- Icons processed: {processed}",
+                    f"- Icons uploaded: {uploaded}",
+                    f"- Icons failed: {failed}",
+                ]
 
-                if stage == "processing":
-                    current_segment = (
-                        f" Current icon: `{current_identifier}`" if current_identifier else ""
+                if downloaded_files:
+                    link_lines = ["", "**Links:**"]
+                    link_lines.extend(
+                        f"- {file_name}: <{wiki_page_url(f'File:{file_name}')}>"
+                        for file_name in downloaded_files
                     )
-                    content = (
-                        f"{dry_run_prefix}Processing {processed}/{total} status icons "
-                        f"for `{cleaned_status_id}`.{current_segment} ({elapsed}s elapsed)"
-                    )
-                elif stage == "completed":
-                    content = (
-                        f"{dry_run_prefix}Status upload for `{cleaned_status_id}` "
-                        f"is wrapping up ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Status upload for `{cleaned_status_id}` "
-                        f"is {stage} ({elapsed}s elapsed)"
-                    )
-
-                msg = await edit_public_message(msg, content)
-
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_status_upload(cleaned_status_id, max_index_value, status_info)
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            processed = status_info.get("processed", total_expected)
-            uploaded = status_info.get("uploaded", 0)
-            failed = status_info.get("failed", 0)
-            downloaded_files = status_info.get("downloaded_files") or []
-
-            summary_lines = [
-                f"{dry_run_prefix}Status upload completed for `{cleaned_status_id}` in {elapsed}s!",
-                "**Summary:**",
-                f"- Icons processed: {processed}",
-                f"- Icons uploaded: {uploaded}",
-                f"- Icons failed: {failed}",
-            ]
-
-            if downloaded_files:
-                base_url = "https://gbf.wiki/File:"
-                unique_files = list(dict.fromkeys(downloaded_files))
-                link_lines = ["", "**Links:**"]
-                link_lines.extend(
-                    f"- {file_name}: <{base_url}{file_name.replace(' ', '_')}>"
-                    for file_name in unique_files
-                )
-                summary_lines.extend(link_lines)
+                    summary_lines.extend(link_lines)
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(
-                msg,
-                content=(
-                    f"{dry_run_prefix}Status upload failed for `{cleaned_status_id}` in {elapsed}s!"
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(
+                    msg,
+                    content=(
+                        f"{DRY_RUN_PREFIX}Status upload failed for `{cleaned_status_id}` in {elapsed}s!"
+                    )
                 )
-            )
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 @bot.tree.command(
     name="bannerupload",
     description="Upload gacha banner variants to the wiki",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     banner_id="Identifier between `banner_` and the trailing index in the CDN URL",
     max_index="Highest banner index to attempt (1-50, defaults to 12)",
@@ -2209,17 +2352,6 @@ async def bannerupload(
     banner_id: str,
     max_index: app_commands.Range[int, 1, 50] = 12,
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     is_valid_banner, cleaned_banner_id = validate_banner_id(banner_id)
     if not is_valid_banner:
         await interaction.response.send_message(cleaned_banner_id, ephemeral=True)
@@ -2227,151 +2359,132 @@ async def bannerupload(
 
     max_index_value = int(max_index or 12)
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/bannerupload` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "bannerupload")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Banner upload started for `{cleaned_banner_id}` "
+            f"{DRY_RUN_PREFIX}Banner upload started for `{cleaned_banner_id}` "
             f"(up to index {max_index_value}). This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status_info = {
-            "stage": "starting",
-            "banner_id": cleaned_banner_id,
-            "processed": 0,
-            "uploaded": 0,
-            "failed": 0,
-            "total": max_index_value,
-            "downloaded_files": [],
-        }
-
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
-                stage = status_info.get("stage", "processing")
-                processed = status_info.get("processed", 0)
-                total = status_info.get("total") or max_index_value
-                current_identifier = status_info.get("current_identifier")
-
-                if stage == "processing":
-                    current_segment = (
-                        f" Current banner: `{current_identifier}`" if current_identifier else ""
-                    )
-                    content = (
-                        f"{dry_run_prefix}Processing {processed}/{total} gacha banners "
-                        f"for `{cleaned_banner_id}`{current_segment} ({elapsed}s elapsed)"
-                    )
-                elif stage == "completed":
-                    content = (
-                        f"{dry_run_prefix}Banner upload for `{cleaned_banner_id}` "
-                        f"is wrapping up ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Banner upload for `{cleaned_banner_id}` "
-                        f"is {stage} ({elapsed}s elapsed)"
-                    )
-
-                msg = await edit_public_message(msg, content)
+        try:
+            start_time = time.monotonic()
+            status_info = UploadStatus(banner_id=cleaned_banner_id, total=max_index_value)
+
+            async def progress_updater():
+                nonlocal msg
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+                    stage = status_info.stage
+                    processed = status_info.processed
+                    total = status_info.total or max_index_value
+                    current_identifier = status_info.current_identifier
+
+                    if stage == "processing":
+                        current_segment = (
+                            f" Current banner: `{current_identifier}`" if current_identifier else ""
+                        )
+                        content = (
+                            f"{DRY_RUN_PREFIX}Processing {processed}/{total} gacha banners "
+                            f"for `{cleaned_banner_id}`{current_segment} ({elapsed}s elapsed)"
+                        )
+                    elif stage == "completed":
+                        # The summary edit follows immediately; a "wrapping up" edit would just be overwritten.
+                        continue
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Banner upload for `{cleaned_banner_id}` "
+                            f"is {stage} ({elapsed}s elapsed)"
+                        )
 
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_banner_upload(
-            cleaned_banner_id, max_index_value, status_info
-        )
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            processed = status_info.get("processed", max_index_value)
-            uploaded = status_info.get("uploaded", 0)
-            failed = status_info.get("failed", 0)
-            downloaded_files = status_info.get("downloaded_files") or []
-            banner_duplicates = status_info.get("banner_duplicates") or []
-
-            summary_lines = [
-                f"{dry_run_prefix}Banner upload completed for `{cleaned_banner_id}` in {elapsed}s!",
-                "**Summary:**",
-                f"- Banners processed: {processed}",
-                f"- Banners uploaded: {uploaded}",
-                f"- Banners failed: {failed}",
-            ]
+                    msg = await edit_public_message(msg, content)
 
-            if downloaded_files:
-                base_url = "https://gbf.wiki/File:"
-                unique_files = list(dict.fromkeys(downloaded_files))
-                link_lines = ["", "**Links:**"]
-                link_lines.extend(
-                    f"- {file_name}: <{base_url}{file_name.replace(' ', '_')}>"
-                    for file_name in unique_files
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_banner_upload(
+                    cleaned_banner_id, max_index_value, status_info, progress=progress
                 )
-                summary_lines.extend(link_lines)
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
+
+            if return_code == 0:
+                processed = status_info.processed
+                uploaded = status_info.uploaded
+                failed = status_info.failed
+                downloaded_files = status_info.downloaded_files
+                banner_duplicates = status_info.banner_duplicates
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Banner upload completed for `{cleaned_banner_id}` in {elapsed}s!",
+                    "**Summary:**",
+                    f"- Banners processed: {processed}",
+                    f"- Banners uploaded: {uploaded}",
+                    f"- Banners failed: {failed}",
+                ]
 
-            if banner_duplicates:
-                base_url = "https://gbf.wiki/File:"
-                summary_lines.append("")
-                summary_lines.append("**Duplicates handled:**")
-                for entry in banner_duplicates:
-                    requested = entry.get("requested")
-                    canonical = entry.get("canonical")
-                    duplicates = entry.get("duplicates") or []
-                    redirect_link = (
-                        f"<{base_url}{requested.replace(' ', '_')}>"
-                        if requested
-                        else "N/A"
-                    )
-                    dupe_links = ", ".join(
-                        f"<{base_url}{name.replace(' ', '_')}>"
-                        for name in duplicates
-                    ) if duplicates else "None listed"
-                    summary_lines.append(
-                        f"- `{requested}` redirected to `{canonical}`"
-                    )
-                    summary_lines.append(
-                        f"  Redirect: {redirect_link}; Dupes: {dupe_links}"
+                if downloaded_files:
+                    link_lines = ["", "**Links:**"]
+                    link_lines.extend(
+                        f"- {file_name}: <{wiki_page_url(f'File:{file_name}')}>"
+                        for file_name in downloaded_files
                     )
+                    summary_lines.extend(link_lines)
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(
-                msg,
-                content=f"{dry_run_prefix}Banner upload failed for `{cleaned_banner_id}` in {elapsed}s!"
-            )
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                if banner_duplicates:
+                    summary_lines.append("")
+                    summary_lines.append("**Duplicates handled:**")
+                    for entry in banner_duplicates:
+                        requested = entry.get("requested")
+                        canonical = entry.get("canonical")
+                        duplicates = entry.get("duplicates") or []
+                        redirect_link = (
+                            f"<{wiki_page_url(f'File:{requested}')}>"
+                            if requested
+                            else "N/A"
+                        )
+                        dupe_links = ", ".join(
+                            f"<{wiki_page_url(f'File:{name}')}>"
+                            for name in duplicates
+                        ) if duplicates else "None listed"
+                        summary_lines.append(
+                            f"- `{requested}` redirected to `{canonical}`"
+                        )
+                        summary_lines.append(
+                            f"  Redirect: {redirect_link}; Dupes: {dupe_links}"
+                        )
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(
+                    msg,
+                    content=f"{DRY_RUN_PREFIX}Banner upload failed for `{cleaned_banner_id}` in {elapsed}s!"
+                )
+                await send_error_details(interaction, stderr)
+
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 @bot.tree.command(
     name="drawupdate",
     description="Update MainPageDraw single/double/element draw promotion subtemplates",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     mode="Which main draw layout to publish",
     end_date="Banner end date in JST (YYYY-MM-DD)",
@@ -2398,17 +2511,6 @@ async def drawupdate(
     link_target: str = "Draw",
     element_start: app_commands.Choice[str] | None = None,
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     mode_value = mode.value
     if mode_value not in DRAW_MODE_SET:
         await interaction.response.send_message("Invalid mode option.", ephemeral=True)
@@ -2440,46 +2542,27 @@ async def drawupdate(
             return
         cleaned_right_banner = right_banner_result
 
-    if mode_value == "single":
-        if cleaned_right_banner:
-            await interaction.response.send_message(
-                'right_banner_id must not be set when mode is "single".',
-                ephemeral=True,
-            )
-            return
-        if right_count is not None:
-            await interaction.response.send_message(
-                'right_count must not be set when mode is "single".',
-                ephemeral=True,
-            )
-            return
-    elif mode_value == "double":
-        if not cleaned_right_banner:
-            await interaction.response.send_message(
-                'right_banner_id is required when mode is "double".',
-                ephemeral=True,
-            )
-            return
-    elif mode_value == "element-single":
-        if cleaned_right_banner:
-            await interaction.response.send_message(
-                'right_banner_id must not be set when mode is "element-single".',
-                ephemeral=True,
-            )
-            return
-        if right_count is not None:
-            await interaction.response.send_message(
-                'right_count must not be set when mode is "element-single".',
-                ephemeral=True,
-            )
-            return
-    elif mode_value == "element-double":
+    # Double modes need a right banner; single modes take no right-side inputs at all
+    is_double = mode_value in DRAW_DOUBLE_MODES
+    if is_double:
         if not cleaned_right_banner:
             await interaction.response.send_message(
-                'right_banner_id is required when mode is "element-double".',
+                f'right_banner_id is required when mode is "{mode_value}".',
                 ephemeral=True,
             )
             return
+    elif cleaned_right_banner:
+        await interaction.response.send_message(
+            f'right_banner_id must not be set when mode is "{mode_value}".',
+            ephemeral=True,
+        )
+        return
+    elif right_count is not None:
+        await interaction.response.send_message(
+            f'right_count must not be set when mode is "{mode_value}".',
+            ephemeral=True,
+        )
+        return
 
     is_valid_link, cleaned_link_target = validate_draw_link_target(link_target)
     if not is_valid_link:
@@ -2490,142 +2573,137 @@ async def drawupdate(
     left_count_value = int(left_count) if left_count is not None else None
     right_count_value = int(right_count) if right_count is not None else None
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/drawupdate` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "drawupdate")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Draw update started for mode `{mode_value}` "
+            f"{DRY_RUN_PREFIX}Draw update started for mode `{mode_value}` "
             f"(left: `{cleaned_left_banner}`, element_start: `{element_start_value}`). This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status_info = {
-            "stage": "starting",
-            "left_files": [],
-            "right_files": [],
-            "saved_pages": [],
-        }
+        try:
+            start_time = time.monotonic()
+            status_info = {
+                "stage": "starting",
+                "left_files": [],
+                "right_files": [],
+                "saved_pages": [],
+            }
+
+            async def progress_updater():
+                nonlocal msg
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+                    stage = status_info.get("stage", "processing")
+                    if stage == "resolving_files":
+                        content = (
+                            f"{DRY_RUN_PREFIX}Resolving banner files for `{mode_value}` mode "
+                            f"({elapsed}s elapsed)"
+                        )
+                    elif stage == "saving_pages":
+                        pages = status_info.get("pages") or []
+                        content = (
+                            f"{DRY_RUN_PREFIX}Saving draw subtemplates ({len(pages)} pages) "
+                            f"({elapsed}s elapsed)"
+                        )
+                    elif stage == "completed":
+                        content = (
+                            f"{DRY_RUN_PREFIX}Draw update is wrapping up ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Draw update is {stage} ({elapsed}s elapsed)"
+                        )
+                    msg = await edit_public_message(msg, content)
 
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
-                stage = status_info.get("stage", "processing")
-                if stage == "resolving_files":
-                    content = (
-                        f"{dry_run_prefix}Resolving banner files for `{mode_value}` mode "
-                        f"({elapsed}s elapsed)"
-                    )
-                elif stage == "saving_pages":
-                    pages = status_info.get("pages") or []
-                    content = (
-                        f"{dry_run_prefix}Saving draw subtemplates ({len(pages)} pages) "
-                        f"({elapsed}s elapsed)"
-                    )
-                elif stage == "completed":
-                    content = (
-                        f"{dry_run_prefix}Draw update is wrapping up ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Draw update is {stage} ({elapsed}s elapsed)"
-                    )
-                msg = await edit_public_message(msg, content)
-
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_draw_update(
-            mode_value,
-            cleaned_end_datetime,
-            cleaned_left_banner,
-            cleaned_right_banner,
-            left_count_value,
-            right_count_value,
-            max_probe_value,
-            cleaned_link_target,
-            element_start_value,
-            status_info,
-        )
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            left_files = status_info.get("left_files") or []
-            right_files = status_info.get("right_files") or []
-            saved_pages = status_info.get("saved_pages") or []
-
-            left_count_used = len(left_files)
-            right_count_used = len(right_files)
-            left_count_source = (
-                f"manual={left_count_value}" if left_count_value is not None else f"auto={left_count_used}"
-            )
-            right_count_source = (
-                f"manual={right_count_value}" if right_count_value is not None else f"auto={right_count_used}"
-            )
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_draw_update(
+                    mode_value,
+                    cleaned_end_datetime,
+                    cleaned_left_banner,
+                    cleaned_right_banner,
+                    left_count_value,
+                    right_count_value,
+                    max_probe_value,
+                    cleaned_link_target,
+                    element_start_value,
+                    status_info,
+                    progress=progress,
+                )
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
+
+            if return_code == 0:
+                left_files = status_info.get("left_files") or []
+                right_files = status_info.get("right_files") or []
+                saved_pages = status_info.get("saved_pages") or []
+
+                left_count_used = len(left_files)
+                right_count_used = len(right_files)
+                left_count_source = (
+                    f"manual={left_count_value}" if left_count_value is not None else f"auto={left_count_used}"
+                )
+                right_count_source = (
+                    f"manual={right_count_value}" if right_count_value is not None else f"auto={right_count_used}"
+                )
 
-            summary_lines = [
-                f"{dry_run_prefix}Draw update completed in {elapsed}s.",
-                "**Inputs used:**",
-                f"- mode: `{mode_value}`",
-                f"- end_date: `{cleaned_end_date}`",
-                f"- end_time: `{cleaned_end_time}`",
-                f"- left_banner_id: `{cleaned_left_banner}`",
-                f"- left_count: `{left_count_source}`",
-                f"- max_probe: `{max_probe_value}`",
-                f"- link_target: `{cleaned_link_target}`",
-                f"- element_start: `{element_start_value}`",
-            ]
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Draw update completed in {elapsed}s.",
+                    "**Inputs used:**",
+                    f"- mode: `{mode_value}`",
+                    f"- end_date: `{cleaned_end_date}`",
+                    f"- end_time: `{cleaned_end_time}`",
+                    f"- left_banner_id: `{cleaned_left_banner}`",
+                    f"- left_count: `{left_count_source}`",
+                    f"- max_probe: `{max_probe_value}`",
+                    f"- link_target: `{cleaned_link_target}`",
+                    f"- element_start: `{element_start_value}`",
+                ]
 
-            if mode_value in ("double", "element-double"):
-                summary_lines.append(f"- right_banner_id: `{cleaned_right_banner}`")
-                summary_lines.append(f"- right_count: `{right_count_source}`")
-
-            summary_lines.append("")
-            summary_lines.append("**Updated pages:**")
-            for page in saved_pages:
-                page_url = f"https://gbf.wiki/{page.replace(' ', '_')}"
-                summary_lines.append(f"- <{page_url}>")
-
-            summary_lines.append("")
-            summary_lines.append("**Banner files used:**")
-            summary_lines.extend(f"- Left: `{name}`" for name in left_files)
-            if mode_value in ("double", "element-double"):
-                summary_lines.extend(f"- Right: `{name}`" for name in right_files)
-
-            summary_lines.append("")
-            summary_lines.append(
-                f"Please purge Main Page to show changes immediately: {MAIN_PAGE_PURGE_URL}"
-            )
+                if is_double:
+                    summary_lines.extend([
+                        f"- right_banner_id: `{cleaned_right_banner}`",
+                        f"- right_count: `{right_count_source}`",
+                    ])
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(msg, f"{dry_run_prefix}Draw update failed in {elapsed}s.")
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                summary_lines.extend(["", "**Updated pages:**"])
+                summary_lines.extend(
+                    f"- <{wiki_page_url(page)}>" for page in saved_pages
+                )
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+                summary_lines.extend(["", "**Banner files used:**"])
+                summary_lines.extend(f"- Left: `{name}`" for name in left_files)
+                if is_double:
+                    summary_lines.extend(f"- Right: `{name}`" for name in right_files)
+
+                summary_lines.extend([
+                    "",
+                    f"Please purge Main Page to show changes immediately: {MAIN_PAGE_PURGE_URL}",
+                ])
+
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(msg, f"{DRY_RUN_PREFIX}Draw update failed in {elapsed}s.")
+                await send_error_details(interaction, stderr)
+
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 @drawupdate.autocomplete("end_time")
@@ -2636,17 +2714,17 @@ async def drawupdate_end_time_autocomplete(
     """Suggest common draw end times while allowing custom HH:MM input."""
     current_clean = (current or "").strip()
     filtered = [
-        t for t in DRAW_COMMON_END_TIMES
-        if not current_clean or current_clean in t
+        choice for choice in DRAW_END_TIME_CHOICES
+        if not current_clean or current_clean in choice.value
     ]
-    return [app_commands.Choice(name=t, value=t) for t in filtered[:25]]
+    return filtered[:25]
 
 
 @bot.tree.command(
     name="promoupdate",
     description="Update a supported MainPageDraw promo subtemplate",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     promo_type="Which promo section to update",
     promo_id="Promo asset id, banner filename, or full CDN URL",
@@ -2663,17 +2741,6 @@ async def promoupdate(
     end_time: str,
     link_target: str = "Surprise Ticket",
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     promo_type_value = promo_type.value
     if promo_type_value not in PROMO_TYPE_SET:
         await interaction.response.send_message("Invalid promo_type option.", ephemeral=True)
@@ -2701,120 +2768,113 @@ async def promoupdate(
 
     cleaned_end_datetime = f"{cleaned_end_date} {cleaned_end_time}"
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/promoupdate` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "promoupdate")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Promo update started for `{promo_type_value}` "
+            f"{DRY_RUN_PREFIX}Promo update started for `{promo_type_value}` "
             f"using `{cleaned_promo_id}`. This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status_info = {
-            "stage": "starting",
-            "saved_pages": [],
-            "resolved_file_name": "",
-        }
+        try:
+            start_time = time.monotonic()
+            status_info = {
+                "stage": "starting",
+                "saved_pages": [],
+                "resolved_file_name": "",
+            }
+
+            async def progress_updater():
+                nonlocal msg
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+                    stage = status_info.get("stage", "processing")
+                    if stage == "validating_file":
+                        resolved_file_name = status_info.get("resolved_file_name") or "?"
+                        content = (
+                            f"{DRY_RUN_PREFIX}Validating promo file `{resolved_file_name}` "
+                            f"on the wiki ({elapsed}s elapsed)"
+                        )
+                    elif stage == "saving_pages":
+                        pages = status_info.get("pages") or []
+                        content = (
+                            f"{DRY_RUN_PREFIX}Saving promo subtemplates ({len(pages)} pages) "
+                            f"({elapsed}s elapsed)"
+                        )
+                    elif stage == "completed":
+                        content = (
+                            f"{DRY_RUN_PREFIX}Promo update is wrapping up ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Promo update is {stage} ({elapsed}s elapsed)"
+                        )
+                    msg = await edit_public_message(msg, content)
 
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
-                stage = status_info.get("stage", "processing")
-                if stage == "validating_file":
-                    resolved_file_name = status_info.get("resolved_file_name") or "?"
-                    content = (
-                        f"{dry_run_prefix}Validating promo file `{resolved_file_name}` "
-                        f"on the wiki ({elapsed}s elapsed)"
-                    )
-                elif stage == "saving_pages":
-                    pages = status_info.get("pages") or []
-                    content = (
-                        f"{dry_run_prefix}Saving promo subtemplates ({len(pages)} pages) "
-                        f"({elapsed}s elapsed)"
-                    )
-                elif stage == "completed":
-                    content = (
-                        f"{dry_run_prefix}Promo update is wrapping up ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Promo update is {stage} ({elapsed}s elapsed)"
-                    )
-                msg = await edit_public_message(msg, content)
-
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_promo_update(
-            promo_type_value,
-            cleaned_promo_id,
-            cleaned_end_datetime,
-            cleaned_link_target,
-            status_info,
-        )
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            saved_pages = status_info.get("saved_pages") or []
-            resolved_file_name = status_info.get("resolved_file_name") or f"banner_{cleaned_promo_id}.png"
-
-            summary_lines = [
-                f"{dry_run_prefix}Promo update completed for `{promo_type_value}` in {elapsed}s.",
-                "**Inputs used:**",
-                f"- promo_type: `{promo_type_value}`",
-                f"- promo_id: `{cleaned_promo_id}`",
-                f"- end_date: `{cleaned_end_date}`",
-                f"- end_time: `{cleaned_end_time}`",
-                f"- link_target: `{cleaned_link_target}`",
-                "",
-                "**Resolved file:**",
-                f"- `{resolved_file_name}`",
-                "",
-                "**Updated pages:**",
-            ]
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_promo_update(
+                    promo_type_value,
+                    cleaned_promo_id,
+                    cleaned_end_datetime,
+                    cleaned_link_target,
+                    status_info,
+                    progress=progress,
+                )
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
+
+            if return_code == 0:
+                saved_pages = status_info.get("saved_pages") or []
+                resolved_file_name = status_info.get("resolved_file_name") or f"banner_{cleaned_promo_id}.png"
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Promo update completed for `{promo_type_value}` in {elapsed}s.",
+                    "**Inputs used:**",
+                    f"- promo_type: `{promo_type_value}`",
+                    f"- promo_id: `{cleaned_promo_id}`",
+                    f"- end_date: `{cleaned_end_date}`",
+                    f"- end_time: `{cleaned_end_time}`",
+                    f"- link_target: `{cleaned_link_target}`",
+                    "",
+                    "**Resolved file:**",
+                    f"- `{resolved_file_name}`",
+                    "",
+                    "**Updated pages:**",
+                ]
 
-            for page in saved_pages:
-                page_url = f"https://gbf.wiki/{page.replace(' ', '_')}"
-                summary_lines.append(f"- <{page_url}>")
+                summary_lines.extend(f"- <{wiki_page_url(page)}>" for page in saved_pages)
 
-            summary_lines.append("")
-            summary_lines.append(
-                f"Please purge Main Page to show changes immediately: {MAIN_PAGE_PURGE_URL}"
-            )
+                summary_lines.append("")
+                summary_lines.append(
+                    f"Please purge Main Page to show changes immediately: {MAIN_PAGE_PURGE_URL}"
+                )
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(
-                msg,
-                content=f"{dry_run_prefix}Promo update failed for `{promo_type_value}` in {elapsed}s."
-            )
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(
+                    msg,
+                    content=f"{DRY_RUN_PREFIX}Promo update failed for `{promo_type_value}` in {elapsed}s."
+                )
+                await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 @promoupdate.autocomplete("end_time")
@@ -2824,17 +2884,17 @@ async def promoupdate_end_time_autocomplete(
 ) -> list[app_commands.Choice[str]]:
     current_clean = (current or "").strip()
     filtered = [
-        t for t in DRAW_COMMON_END_TIMES
-        if not current_clean or current_clean in t
+        choice for choice in DRAW_END_TIME_CHOICES
+        if not current_clean or current_clean in choice.value
     ]
-    return [app_commands.Choice(name=t, value=t) for t in filtered[:25]]
+    return filtered[:25]
 
 
 @bot.tree.command(
     name="rateup",
     description="Update MainPageDraw rate-up characters subtemplate",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     end_date="Rate-up end date in JST (YYYY-MM-DD)",
     end_time="Rate-up end time in JST (HH:MM). Common values: 18:59, 11:59, 23:59",
@@ -2848,17 +2908,6 @@ async def rateup(
     rateups: str,
     sparkable: str,
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     is_valid_date, cleaned_end_date = validate_draw_end_date(end_date)
     if not is_valid_date:
         await interaction.response.send_message(cleaned_end_date, ephemeral=True)
@@ -2895,105 +2944,98 @@ async def rateup(
         )
         return
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/rateup` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "rateup")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Rate-up update started "
+            f"{DRY_RUN_PREFIX}Rate-up update started "
             f"(rateups: `{len(rateup_names)}`, sparkable: `{len(sparkable_names)}`). This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status_info = {
-            "stage": "starting",
-            "saved_pages": [],
-            "rateups": rateup_names,
-            "sparkable": sparkable_names,
-        }
+        try:
+            start_time = time.monotonic()
+            status_info = {
+                "stage": "starting",
+                "saved_pages": [],
+                "rateups": rateup_names,
+                "sparkable": sparkable_names,
+            }
+
+            async def progress_updater():
+                nonlocal msg
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+                    stage = status_info.get("stage", "processing")
+                    if stage == "saving_pages":
+                        pages = status_info.get("pages") or []
+                        content = (
+                            f"{DRY_RUN_PREFIX}Saving rate-up subtemplates ({len(pages)} pages) "
+                            f"({elapsed}s elapsed)"
+                        )
+                    elif stage == "completed":
+                        content = (
+                            f"{DRY_RUN_PREFIX}Rate-up update is wrapping up ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Rate-up update is {stage} ({elapsed}s elapsed)"
+                        )
+                    msg = await edit_public_message(msg, content)
 
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
-                stage = status_info.get("stage", "processing")
-                if stage == "saving_pages":
-                    pages = status_info.get("pages") or []
-                    content = (
-                        f"{dry_run_prefix}Saving rate-up subtemplates ({len(pages)} pages) "
-                        f"({elapsed}s elapsed)"
-                    )
-                elif stage == "completed":
-                    content = (
-                        f"{dry_run_prefix}Rate-up update is wrapping up ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Rate-up update is {stage} ({elapsed}s elapsed)"
-                    )
-                msg = await edit_public_message(msg, content)
-
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_rateup_update(
-            cleaned_end_datetime,
-            rateup_names,
-            sparkable_names,
-            status_info,
-        )
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            saved_pages = status_info.get("saved_pages") or []
-
-            summary_lines = [
-                f"{dry_run_prefix}Rate-up update completed in {elapsed}s.",
-                "**Inputs used:**",
-                f"- end_date: `{cleaned_end_date}`",
-                f"- end_time: `{cleaned_end_time}`",
-                f"- rateups: `{ '|'.join(rateup_names) if rateup_names else '(none)' }`",
-                f"- sparkable: `{ '|'.join(sparkable_names) if sparkable_names else '(none)' }`",
-                "",
-                "**Updated pages:**",
-            ]
-            for page in saved_pages:
-                page_url = f"https://gbf.wiki/{page.replace(' ', '_')}"
-                summary_lines.append(f"- <{page_url}>")
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_rateup_update(
+                    cleaned_end_datetime,
+                    rateup_names,
+                    sparkable_names,
+                    status_info,
+                    progress=progress,
+                )
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
+
+            if return_code == 0:
+                saved_pages = status_info.get("saved_pages") or []
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Rate-up update completed in {elapsed}s.",
+                    "**Inputs used:**",
+                    f"- end_date: `{cleaned_end_date}`",
+                    f"- end_time: `{cleaned_end_time}`",
+                    f"- rateups: `{ '|'.join(rateup_names) if rateup_names else '(none)' }`",
+                    f"- sparkable: `{ '|'.join(sparkable_names) if sparkable_names else '(none)' }`",
+                    "",
+                    "**Updated pages:**",
+                ]
+                summary_lines.extend(f"- <{wiki_page_url(page)}>" for page in saved_pages)
 
-            summary_lines.extend([
-                "",
-                f"Please purge Main Page to show changes immediately: {MAIN_PAGE_PURGE_URL}",
-            ])
+                summary_lines.extend([
+                    "",
+                    f"Please purge Main Page to show changes immediately: {MAIN_PAGE_PURGE_URL}",
+                ])
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(msg, f"{dry_run_prefix}Rate-up update failed in {elapsed}s.")
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(msg, f"{DRY_RUN_PREFIX}Rate-up update failed in {elapsed}s.")
+                await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 @rateup.autocomplete("end_time")
@@ -3004,17 +3046,17 @@ async def rateup_end_time_autocomplete(
     """Suggest common rate-up end times while allowing custom HH:MM input."""
     current_clean = (current or "").strip()
     filtered = [
-        t for t in DRAW_COMMON_END_TIMES
-        if not current_clean or current_clean in t
+        choice for choice in DRAW_END_TIME_CHOICES
+        if not current_clean or current_clean in choice.value
     ]
-    return [app_commands.Choice(name=t, value=t) for t in filtered[:25]]
+    return filtered[:25]
 
 
 @bot.tree.command(
     name="risingrotation",
     description="Insert a new GBVSR rotation row on the dedicated rotation subpage",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     start_date="Rotation start date in JST (YYYY-MM-DD). Default start time is 11:00.",
     c2="Second character slot. Suggestions provided; custom entries allowed.",
@@ -3042,17 +3084,6 @@ async def risingrotation(
     end_date_override: str = "",
     end_time_override: str = "",
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     is_valid_start_date, cleaned_start_date = validate_draw_end_date(start_date)
     if not is_valid_start_date:
         await interaction.response.send_message(
@@ -3082,10 +3113,7 @@ async def risingrotation(
         )
         return
 
-    start_datetime = datetime.strptime(
-        f"{cleaned_start_date} {cleaned_start_time}",
-        "%Y-%m-%d %H:%M",
-    )
+    start_datetime = parse_draw_datetime(f"{cleaned_start_date} {cleaned_start_time}")
     cleaned_end_date = (start_datetime + timedelta(days=7)).strftime("%Y-%m-%d")
     cleaned_end_time = RISING_ROTATION_DEFAULT_END_TIME
     end_source = "auto"
@@ -3126,125 +3154,120 @@ async def risingrotation(
     start_datetime_text = f"{cleaned_start_date} {cleaned_start_time}"
     end_datetime_text = f"{cleaned_end_date} {cleaned_end_time}"
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/risingrotation` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "risingrotation")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}GBVSR rotation update started for `{RISING_ROTATION_PAGE}`. This may take a while..."
+            f"{DRY_RUN_PREFIX}GBVSR rotation update started for `{RISING_ROTATION_PAGE}`. This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status_info = {
-            "stage": "starting",
-            "page": RISING_ROTATION_PAGE,
-            "resolved_week": None,
-            "week_source": "auto",
-            "row_text": "",
-            "start_datetime_text": start_datetime_text,
-            "end_datetime_text": end_datetime_text,
-        }
+        try:
+            start_time = time.monotonic()
+            status_info = {
+                "stage": "starting",
+                "page": RISING_ROTATION_PAGE,
+                "resolved_week": None,
+                "week_source": "auto",
+                "row_text": "",
+                "start_datetime_text": start_datetime_text,
+                "end_datetime_text": end_datetime_text,
+            }
+
+            async def progress_updater():
+                nonlocal msg
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+                    stage = status_info.get("stage", "processing")
+                    if stage == "loading_page":
+                        content = (
+                            f"{DRY_RUN_PREFIX}Loading `{RISING_ROTATION_PAGE}` "
+                            f"({elapsed}s elapsed)"
+                        )
+                    elif stage == "saving_page":
+                        resolved_week = status_info.get("resolved_week")
+                        content = (
+                            f"{DRY_RUN_PREFIX}Saving week `{resolved_week}` to `{RISING_ROTATION_PAGE}` "
+                            f"({elapsed}s elapsed)"
+                        )
+                    elif stage == "completed":
+                        content = (
+                            f"{DRY_RUN_PREFIX}GBVSR rotation update is wrapping up ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}GBVSR rotation update is {stage} ({elapsed}s elapsed)"
+                        )
+                    msg = await edit_public_message(msg, content)
 
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
-                stage = status_info.get("stage", "processing")
-                if stage == "loading_page":
-                    content = (
-                        f"{dry_run_prefix}Loading `{RISING_ROTATION_PAGE}` "
-                        f"({elapsed}s elapsed)"
-                    )
-                elif stage == "saving_page":
-                    resolved_week = status_info.get("resolved_week")
-                    content = (
-                        f"{dry_run_prefix}Saving week `{resolved_week}` to `{RISING_ROTATION_PAGE}` "
-                        f"({elapsed}s elapsed)"
-                    )
-                elif stage == "completed":
-                    content = (
-                        f"{dry_run_prefix}GBVSR rotation update is wrapping up ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}GBVSR rotation update is {stage} ({elapsed}s elapsed)"
-                    )
-                msg = await edit_public_message(msg, content)
-
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_rising_rotation_update(
-            start_datetime_text,
-            end_datetime_text,
-            validated_characters,
-            cleaned_notes,
-            week_override,
-            status_info,
-        )
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            resolved_week = status_info.get("resolved_week")
-            row_text = status_info.get("row_text") or ""
-            page_url = f"https://gbf.wiki/{RISING_ROTATION_PAGE.replace(' ', '_')}"
-
-            summary_lines = [
-                f"{dry_run_prefix}GBVSR rotation update completed in {elapsed}s.",
-                "**Resolved values:**",
-                f"- page: `{RISING_ROTATION_PAGE}`",
-                f"- week: `{resolved_week}` ({status_info.get('week_source', 'auto')})",
-                f"- start: `{start_datetime_text} JST` ({start_time_source})",
-                f"- end: `{end_datetime_text} JST` ({end_source})",
-                "",
-                "**Characters:**",
-            ]
-            for field_name in ("c1", "c2", "c3", "c4", "c5"):
-                value = validated_characters.get(field_name, "")
-                if value:
-                    summary_lines.append(f"- {field_name}: `{value}`")
-            if cleaned_notes:
-                summary_lines.append(f"- notes: `{cleaned_notes}`")
-
-            summary_lines.extend([
-                "",
-                "**Updated page:**",
-                f"- <{page_url}>",
-                "",
-                "**Inserted row:**",
-                "```wikitext",
-                row_text,
-                "```",
-            ])
-
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(msg, f"{dry_run_prefix}GBVSR rotation update failed in {elapsed}s.")
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_rising_rotation_update(
+                    start_datetime_text,
+                    end_datetime_text,
+                    validated_characters,
+                    cleaned_notes,
+                    week_override,
+                    status_info,
+                    progress=progress,
+                )
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
+
+            if return_code == 0:
+                resolved_week = status_info.get("resolved_week")
+                row_text = status_info.get("row_text") or ""
+                page_url = RISING_ROTATION_PAGE_URL
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}GBVSR rotation update completed in {elapsed}s.",
+                    "**Resolved values:**",
+                    f"- page: `{RISING_ROTATION_PAGE}`",
+                    f"- week: `{resolved_week}` ({status_info.get('week_source', 'auto')})",
+                    f"- start: `{start_datetime_text} JST` ({start_time_source})",
+                    f"- end: `{end_datetime_text} JST` ({end_source})",
+                    "",
+                    "**Characters:**",
+                ]
+                for field_name in ("c1", "c2", "c3", "c4", "c5"):
+                    value = validated_characters.get(field_name, "")
+                    if value:
+                        summary_lines.append(f"- {field_name}: `{value}`")
+                if cleaned_notes:
+                    summary_lines.append(f"- notes: `{cleaned_notes}`")
+
+                summary_lines.extend([
+                    "",
+                    "**Updated page:**",
+                    f"- <{page_url}>",
+                    "",
+                    "**Inserted row:**",
+                    "```wikitext",
+                    row_text,
+                    "```",
+                ])
+
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(msg, f"{DRY_RUN_PREFIX}GBVSR rotation update failed in {elapsed}s.")
+                await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 @risingrotation.autocomplete("c1")
@@ -3258,11 +3281,11 @@ async def risingrotation_character_autocomplete(
 ) -> list[app_commands.Choice[str]]:
     current_lower = (current or "").strip().lower()
     filtered = [
-        name
-        for name in RISING_ROTATION_AUTOCOMPLETE_NAMES
-        if not current_lower or current_lower in name.lower()
+        choice
+        for name_lower, choice in RISING_ROTATION_AUTOCOMPLETE_CHOICES
+        if not current_lower or current_lower in name_lower
     ]
-    return [app_commands.Choice(name=name, value=name) for name in filtered[:25]]
+    return filtered[:25]
 
 
 @bot.tree.command(
@@ -3339,11 +3362,11 @@ async def synccommands(interaction: discord.Interaction):
         )
         return
 
-    member = guild.get_member(interaction.user.id)
-    is_admin = False
-    if member:
-        perms = member.guild_permissions
-        is_admin = perms.administrator or member.id == guild.owner_id
+    member = interaction_member(interaction)
+    # Owner check first: guild_permissions walks every role the member holds
+    is_admin = member is not None and (
+        member.id == guild.owner_id or member.guild_permissions.administrator
+    )
 
     if not is_admin:
         await interaction.response.send_message(
@@ -3376,7 +3399,7 @@ async def synccommands(interaction: discord.Interaction):
     name="itemupload",
     description="Upload square/icon variants for a single item by id",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     item_type="CDN folder name (article, normal, etc.). Suggestions provided; custom entries allowed.",
     item_id="Item ID (from the image URL path)",
@@ -3388,17 +3411,6 @@ async def itemupload(
     item_id: str,
     item_name: str
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True
-        )
-        return
-
     is_valid_id, cleaned_id = validate_item_id(item_id)
     if not is_valid_id:
         await interaction.response.send_message(cleaned_id, ephemeral=True)
@@ -3417,118 +3429,110 @@ async def itemupload(
         )
         return
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/itemupload` again.",
-            ephemeral=True
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "itemupload")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Single-item upload started for `{cleaned_name}` "
+            f"{DRY_RUN_PREFIX}Single-item upload started for `{cleaned_name}` "
             f"(type: `{item_type_value}`, ID: `{cleaned_id}`). This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-
-        status = {"stage": "starting", "details": "", "item_type": item_type_value}
-
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
+        try:
+            start_time = time.monotonic()
+
+            status = {"stage": "starting", "details": "", "item_type": item_type_value}
+
+            async def progress_updater():
+                nonlocal msg
+                # Only the counters and elapsed time change between edits
+                item_label = f"`{cleaned_name}` (type: `{item_type_value}`, ID: `{cleaned_id}`)"
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+
+                    stage = status.get("stage", "processing")
+                    if stage == "processing":
+                        processed = status.get("processed", 0)
+                        total = status.get("total")
+                        total_display = total if total else "?"
+                        current_image = status.get("current_image")
+                        current_segment = f" Current: {current_image}" if current_image else ""
+                        content = (
+                            f"{DRY_RUN_PREFIX}Processing {processed}/{total_display} images for "
+                            f"{item_label}.{current_segment} ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Item upload for {item_label} "
+                            f"is running... ({elapsed}s elapsed)"
+                        )
 
-                stage = status.get("stage", "processing")
-                if stage == "processing":
-                    processed = status.get("processed", 0)
-                    total = status.get("total")
-                    total_display = total if total else "?"
-                    current_image = status.get("current_image")
-                    current_segment = f" Current: {current_image}" if current_image else ""
-                    content = (
-                        f"{dry_run_prefix}Processing {processed}/{total_display} images for "
-                        f"`{cleaned_name}` (type: `{item_type_value}`, ID: `{cleaned_id}`)."
-                        f"{current_segment} ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Item upload for `{cleaned_name}` "
-                        f"(type: `{item_type_value}`, ID: `{cleaned_id}`) "
-                        f"is running... ({elapsed}s elapsed)"
-                    )
+                    msg = await edit_public_message(msg, content)
 
-                msg = await edit_public_message(msg, content)
-
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_item_upload(item_type_value, cleaned_id, cleaned_name, status)
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            processed = status.get("processed", 0)
-            uploaded = status.get("uploaded", 0)
-            duplicate_matches = status.get("duplicates", 0)
-            total_checked = status.get("total_urls", 0)
-
-            summary_lines = [
-                f"{dry_run_prefix}Item upload completed for `{cleaned_name}` "
-                f"(type: `{item_type_value}`, ID: `{cleaned_id}`) in {elapsed}s!",
-                "**Summary:**",
-                f"- Variants processed: {processed}",
-                f"- Images uploaded: {uploaded}",
-                f"- Images found as duplicates: {duplicate_matches}",
-                f"- Total URLs checked: {total_checked}",
-            ]
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_item_upload(
+                    item_type_value, cleaned_id, cleaned_name, status, progress=progress
+                )
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
 
-            base_url = "https://gbf.wiki/File:"
-            canonical_s_file = f"item_{item_type_value}_s_{cleaned_id}.jpg"
-            canonical_m_file = f"item_{item_type_value}_m_{cleaned_id}.jpg"
-            redirect_square_file = f"{cleaned_name}_square.jpg"
-            redirect_icon_file = f"{cleaned_name}_icon.jpg"
-
-            link_lines = [
-                "",
-                "**Links:**",
-                f"- Canonical S: <{base_url}{canonical_s_file.replace(' ', '_')}>",
-                f"- Canonical M: <{base_url}{canonical_m_file.replace(' ', '_')}>",
-                f"- Redirect Square: <{base_url}{redirect_square_file.replace(' ', '_')}>",
-                f"- Redirect Icon: <{base_url}{redirect_icon_file.replace(' ', '_')}>",
-            ]
+            if return_code == 0:
+                processed = status.get("processed", 0)
+                uploaded = status.get("uploaded", 0)
+                duplicate_matches = status.get("duplicates", 0)
+                total_checked = status.get("total_urls", 0)
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Item upload completed for `{cleaned_name}` "
+                    f"(type: `{item_type_value}`, ID: `{cleaned_id}`) in {elapsed}s!",
+                    "**Summary:**",
+                    f"- Variants processed: {processed}",
+                    f"- Images uploaded: {uploaded}",
+                    f"- Images found as duplicates: {duplicate_matches}",
+                    f"- Total URLs checked: {total_checked}",
+                ]
 
-            summary_lines.extend(link_lines)
+                link_files = (
+                    ("Canonical S", f"item_{item_type_value}_s_{cleaned_id}.jpg"),
+                    ("Canonical M", f"item_{item_type_value}_m_{cleaned_id}.jpg"),
+                    ("Redirect Square", f"{cleaned_name}_square.jpg"),
+                    ("Redirect Icon", f"{cleaned_name}_icon.jpg"),
+                )
+                summary_lines.append("")
+                summary_lines.append("**Links:**")
+                summary_lines.extend(
+                    f"- {label}: <{wiki_page_url(f'File:{file_name}')}>"
+                    for label, file_name in link_files
+                )
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(
-                msg,
-                content=(
-                    f"{dry_run_prefix}Item upload failed for `{cleaned_name}` "
-                    f"(type: `{item_type_value}`, ID: `{cleaned_id}`) in {elapsed}s!"
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(
+                    msg,
+                    content=(
+                        f"{DRY_RUN_PREFIX}Item upload failed for `{cleaned_name}` "
+                        f"(type: `{item_type_value}`, ID: `{cleaned_id}`) in {elapsed}s!"
+                    )
                 )
-            )
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 
@@ -3536,7 +3540,7 @@ async def itemupload(
     name="eventupload",
     description="Upload event banner and teaser assets",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     event_id="Event folder identifier (e.g. treasureraid169 or biography042)",
     event_name="Event display name (used for redirects)",
@@ -3551,17 +3555,6 @@ async def eventupload(
     asset_type: app_commands.Choice[str],
     max_index: int | None = None,
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     is_valid_event_id, cleaned_event_id = validate_event_id(event_id)
     if not is_valid_event_id:
         await interaction.response.send_message(cleaned_event_id, ephemeral=True)
@@ -3578,16 +3571,7 @@ async def eventupload(
         return
 
     if max_index is None:
-        if asset_type_value == "raid_thumb":
-            max_index = 13
-        elif asset_type_value == "raid_thumb_collab":
-            max_index = 14
-        elif asset_type_value == "raid_thumb_records":
-            max_index = 5
-        elif asset_type_value in {"top", "trailer_mp3"}:
-            max_index = 1
-        else:
-            max_index = WikiImages.EVENT_BANNER_MAX_INDEX
+        max_index = EVENT_ASSET_DEFAULT_MAX_INDEX.get(asset_type_value, WikiImages.EVENT_BANNER_MAX_INDEX)
     if max_index < 1:
         await interaction.response.send_message(
             "Invalid max index. It must be at least 1.",
@@ -3595,160 +3579,154 @@ async def eventupload(
         )
         return
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/eventupload` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "eventupload")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Event upload started for `{cleaned_event_name}` "
+            f"{DRY_RUN_PREFIX}Event upload started for `{cleaned_event_name}` "
             f"(event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`, max index: `{max_index}`). "
             "This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status = {
-            "stage": "starting",
-            "event_id": cleaned_event_id,
-            "asset_type": asset_type_value,
-            "total": max_index,
-        }
-
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
-
-                stage = status.get("stage", "processing")
-                processed = status.get("processed", 0)
-                total = status.get("total") or max_index
-                current_image = status.get("current_image")
-                current_segment = f" Current: {current_image}" if current_image else ""
-
-                if stage == "processing":
-                    content = (
-                        f"{dry_run_prefix}Processing {processed}/{total} event assets for "
-                        f"`{cleaned_event_name}` (event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`)."
-                        f"{current_segment} ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Event upload for `{cleaned_event_name}` "
-                        f"(event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`) "
-                        f"is running... ({elapsed}s elapsed)"
-                    )
+        try:
+            start_time = time.monotonic()
+            status = {
+                "stage": "starting",
+                "event_id": cleaned_event_id,
+                "asset_type": asset_type_value,
+                "total": max_index,
+            }
+
+            async def progress_updater():
+                nonlocal msg
+                # Only the counters and elapsed time change between edits
+                event_label = (
+                    f"`{cleaned_event_name}` (event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`)"
+                )
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+
+                    stage = status.get("stage", "processing")
+                    if stage == "processing":
+                        processed = status.get("processed", 0)
+                        total = status.get("total") or max_index
+                        current_image = status.get("current_image")
+                        current_segment = f" Current: {current_image}" if current_image else ""
+                        content = (
+                            f"{DRY_RUN_PREFIX}Processing {processed}/{total} event assets for "
+                            f"{event_label}.{current_segment} ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Event upload for {event_label} "
+                            f"is running... ({elapsed}s elapsed)"
+                        )
 
-                msg = await edit_public_message(msg, content)
+                    msg = await edit_public_message(msg, content)
 
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_event_upload(
-            cleaned_event_id, cleaned_event_name, asset_type_value, max_index, status
-        )
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            processed = status.get("processed", 0)
-            uploaded = status.get("uploaded", 0)
-            duplicates = status.get("duplicates", 0)
-            failed = status.get("failed", 0)
-            files = status.get("files", [])
-
-            summary_lines = [
-                f"{dry_run_prefix}Event upload completed for `{cleaned_event_name}` "
-                f"(event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`) in {elapsed}s!",
-                "**Summary:**",
-                f"- Images processed: {processed}",
-                f"- Images uploaded: {uploaded}",
-                f"- Images found as duplicates: {duplicates}",
-                f"- Images failed validation: {failed}",
-            ]
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_event_upload(
+                    cleaned_event_id, cleaned_event_name, asset_type_value, max_index, status, progress=progress
+                )
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
 
-            if files:
-                template_redirects = [
-                    redirect_name.replace(" ", "_")
-                    for entry in files
-                    if (redirect_name := entry.get("redirect"))
+            if return_code == 0:
+                processed = status.get("processed", 0)
+                uploaded = status.get("uploaded", 0)
+                duplicates = status.get("duplicates", 0)
+                failed = status.get("failed", 0)
+                files = status.get("files", [])
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Event upload completed for `{cleaned_event_name}` "
+                    f"(event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`) in {elapsed}s!",
+                    "**Summary:**",
+                    f"- Images processed: {processed}",
+                    f"- Images uploaded: {uploaded}",
+                    f"- Images found as duplicates: {duplicates}",
+                    f"- Images failed validation: {failed}",
                 ]
-                if template_redirects and asset_type_value in {"notice", "start"}:
-                    summary_lines.extend([
-                        "",
-                        "**Paste into EventHistory template:**",
-                        "```text",
-                        ";".join(template_redirects),
-                        "```",
-                    ])
-                if asset_type_value == "guide":
-                    gallery_lines = [
+
+                if files:
+                    template_redirects = [
                         redirect_name.replace(" ", "_")
                         for entry in files
                         if (redirect_name := entry.get("redirect"))
                     ]
-                    if gallery_lines:
+                    if template_redirects and asset_type_value in {"notice", "start"}:
                         summary_lines.extend([
                             "",
-                            "**Paste into guide gallery:**",
+                            "**Paste into EventHistory template:**",
                             "```text",
-                            '<gallery mode="nolines" perrow="3" widths="280px" heights="300px" position="left">',
-                            *gallery_lines,
-                            "</gallery>",
+                            ";".join(template_redirects),
                             "```",
                         ])
-
-                base_url = "https://gbf.wiki/File:"
-                link_lines = ["", "**Links:**"]
-                for entry in files:
-                    index = entry.get("index")
-                    canonical_name = entry.get("canonical")
-                    redirect_names = entry.get("redirects") or []
-                    if not redirect_names and entry.get("redirect"):
-                        redirect_names = [entry["redirect"]]
-                    line = (
-                        f"- #{index}: Canonical <{base_url}{canonical_name.replace(' ', '_')}>"
-                    )
-                    if redirect_names:
-                        redirect_links = ", ".join(
-                            f"<{base_url}{redirect_name.replace(' ', '_')}>"
-                            for redirect_name in redirect_names
+                    if asset_type_value == "guide":
+                        gallery_lines = [
+                            redirect_name.replace(" ", "_")
+                            for entry in files
+                            if (redirect_name := entry.get("redirect"))
+                        ]
+                        if gallery_lines:
+                            summary_lines.extend([
+                                "",
+                                "**Paste into guide gallery:**",
+                                "```text",
+                                '<gallery mode="nolines" perrow="3" widths="280px" heights="300px" position="left">',
+                                *gallery_lines,
+                                "</gallery>",
+                                "```",
+                            ])
+
+                    link_lines = ["", "**Links:**"]
+                    for entry in files:
+                        index = entry.get("index")
+                        canonical_name = entry.get("canonical")
+                        redirect_names = entry.get("redirects") or []
+                        if not redirect_names and entry.get("redirect"):
+                            redirect_names = [entry["redirect"]]
+                        line = (
+                            f"- #{index}: Canonical <{wiki_page_url(f'File:{canonical_name}')}>"
                         )
-                        line += f" | Redirect(s) {redirect_links}"
-                    link_lines.append(line)
-                summary_lines.extend(link_lines)
+                        if redirect_names:
+                            redirect_links = ", ".join(
+                                f"<{wiki_page_url(f'File:{redirect_name}')}>"
+                                for redirect_name in redirect_names
+                            )
+                            line += f" | Redirect(s) {redirect_links}"
+                        link_lines.append(line)
+                    summary_lines.extend(link_lines)
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(
-                msg,
-                content=(
-                    f"{dry_run_prefix}Event upload failed for `{cleaned_event_name}` "
-                    f"(event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`) in {elapsed}s!"
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(
+                    msg,
+                    content=(
+                        f"{DRY_RUN_PREFIX}Event upload failed for `{cleaned_event_name}` "
+                        f"(event id: `{cleaned_event_id}`, asset type: `{asset_type_value}`) in {elapsed}s!"
+                    )
                 )
-            )
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 @itemupload.autocomplete("item_type")
@@ -3758,18 +3736,18 @@ async def itemupload_item_type_autocomplete(
 ) -> list[app_commands.Choice[str]]:
     """Suggest common CDN folders while keeping the input free-form."""
     current_lower = (current or "").lower()
-    filtered = [it for it in ITEM_TYPES if not current_lower or current_lower in it]
-    return [
-        app_commands.Choice(name=it.title(), value=it)
-        for it in filtered[:25]
+    filtered = [
+        choice for choice in ITEM_TYPE_CHOICES
+        if not current_lower or current_lower in choice.value
     ]
+    return filtered[:25]
 
 
 @bot.tree.command(
     name="enemyupload",
     description="Upload enemy S/M icons by id",
 )
-@app_commands.checks.has_any_role(*ALLOWED_ROLES)
+@app_commands.check(has_upload_access)
 @app_commands.describe(
     enemy_id="Enemy identifier (numeric) used in the CDN URL.",
 )
@@ -3777,145 +3755,125 @@ async def enemyupload(
     interaction: discord.Interaction,
     enemy_id: str,
 ):
-    member = interaction.guild.get_member(interaction.user.id)
-    if not member or not (
-        any(role.name in ALLOWED_ROLES for role in member.roles)
-        or member.guild.owner_id == interaction.user.id
-    ):
-        await interaction.response.send_message(
-            f"You must have one of the following roles to use this command: {', '.join(ALLOWED_ROLES)}",
-            ephemeral=True,
-        )
-        return
-
     is_valid_enemy_id, cleaned_enemy_id = validate_enemy_id(enemy_id)
     if not is_valid_enemy_id:
         await interaction.response.send_message(cleaned_enemy_id, ephemeral=True)
         return
 
-    now = time.time()
-    last = last_used.get(interaction.user.id, 0)
-    if now - last < COOLDOWN_SECONDS:
-        remaining = int(COOLDOWN_SECONDS - (now - last))
-        await interaction.response.send_message(
-            f"Please wait {remaining}s before using `/enemyupload` again.",
-            ephemeral=True,
-        )
+    cooldown_error = consume_cooldown(interaction.user.id, "enemyupload")
+    if cooldown_error:
+        await interaction.response.send_message(cooldown_error, ephemeral=True)
         return
-    last_used[interaction.user.id] = now
 
-    if upload_lock.locked():
+    if upload_slots.locked():
         await interaction.response.send_message(
             "Another upload is already running. Please wait until it finishes.",
             ephemeral=True,
         )
         return
 
-    async with upload_lock:
-        dry_run_prefix = "[DRY RUN] " if DRY_RUN else ""
+    async with upload_slots:
         await interaction.response.send_message(
-            f"{dry_run_prefix}Enemy upload started for id `{cleaned_enemy_id}`. This may take a while..."
+            f"{DRY_RUN_PREFIX}Enemy upload started for id `{cleaned_enemy_id}`. This may take a while..."
         )
         msg = await get_persistent_response_message(interaction)
 
-    try:
-        start_time = time.time()
-        status = {
-            "stage": "starting",
-            "enemy_id": cleaned_enemy_id,
-            "total": 2,
-        }
+        try:
+            start_time = time.monotonic()
+            status = {
+                "stage": "starting",
+                "enemy_id": cleaned_enemy_id,
+                "total": 2,
+            }
+
+            async def progress_updater():
+                nonlocal msg
+                while True:
+                    await progress.wait()
+                    elapsed = int(time.monotonic() - start_time)
+
+                    stage = status.get("stage", "processing")
+                    processed = status.get("processed", 0)
+                    total = status.get("total", 2)
+                    current_image = status.get("current_image")
+                    current_segment = f" Current: {current_image}" if current_image else ""
 
-        async def progress_updater():
-            nonlocal msg
-            while True:
-                await asyncio.sleep(15)
-                elapsed = int(time.time() - start_time)
+                    if stage == "processing":
+                        content = (
+                            f"{DRY_RUN_PREFIX}Processing {processed}/{total} enemy images for "
+                            f"`{cleaned_enemy_id}`.{current_segment} ({elapsed}s elapsed)"
+                        )
+                    else:
+                        content = (
+                            f"{DRY_RUN_PREFIX}Enemy upload for `{cleaned_enemy_id}` "
+                            f"is running... ({elapsed}s elapsed)"
+                        )
 
-                stage = status.get("stage", "processing")
-                processed = status.get("processed", 0)
-                total = status.get("total", 2)
-                current_image = status.get("current_image")
-                current_segment = f" Current: {current_image}" if current_image else ""
-
-                if stage == "processing":
-                    content = (
-                        f"{dry_run_prefix}Processing {processed}/{total} enemy images for "
-                        f"`{cleaned_enemy_id}`.{current_segment} ({elapsed}s elapsed)"
-                    )
-                else:
-                    content = (
-                        f"{dry_run_prefix}Enemy upload for `{cleaned_enemy_id}` "
-                        f"is running... ({elapsed}s elapsed)"
-                    )
+                    msg = await edit_public_message(msg, content)
 
-                msg = await edit_public_message(msg, content)
-
-        updater_task = asyncio.create_task(progress_updater())
-        return_code, stdout, stderr = await run_enemy_upload(cleaned_enemy_id, status)
-        updater_task.cancel()
-        elapsed = int(time.time() - start_time)
-
-        if return_code == 0:
-            processed = status.get("processed", 0)
-            uploaded = status.get("uploaded", 0)
-            duplicates = status.get("duplicates", 0)
-            failed = status.get("failed", 0)
-            files = status.get("files", [])
-
-            summary_lines = [
-                f"{dry_run_prefix}Enemy upload completed for `{cleaned_enemy_id}` in {elapsed}s!",
-                "**Summary:**",
-                f"- Variants processed: {processed}",
-                f"- Images uploaded: {uploaded}",
-                f"- Images found as duplicates: {duplicates}",
-                f"- Images failed validation: {failed}",
-            ]
+            progress = ProgressSignal()
+            updater_task = asyncio.create_task(progress_updater())
+            try:
+                return_code, stderr = await run_enemy_upload(cleaned_enemy_id, status, progress=progress)
+            finally:
+                await stop_updater(updater_task)
+            elapsed = int(time.monotonic() - start_time)
 
-            if files:
-                base_url = "https://gbf.wiki/File:"
-                link_lines = ["", "**Links:**"]
-                canonical_s = next((f["canonical"] for f in files if f.get("variant") == "s"), None)
-                canonical_m = next((f["canonical"] for f in files if f.get("variant") == "m"), None)
-                redirect_s = next((f["redirect"] for f in files if f.get("variant") == "s"), None)
-                redirect_m = next((f["redirect"] for f in files if f.get("variant") == "m"), None)
-
-                if canonical_s:
-                    link_lines.append(
-                        f"- Canonical S: <{base_url}{canonical_s.replace(' ', '_')}>"
-                    )
-                if canonical_m:
-                    link_lines.append(
-                        f"- Canonical M: <{base_url}{canonical_m.replace(' ', '_')}>"
-                    )
-                if redirect_s:
-                    link_lines.append(
-                        f"- Redirect S: <{base_url}{redirect_s.replace(' ', '_')}>"
-                    )
-                if redirect_m:
-                    link_lines.append(
-                        f"- Redirect M: <{base_url}{redirect_m.replace(' ', '_')}>"
-                    )
+            if return_code == 0:
+                processed = status.get("processed", 0)
+                uploaded = status.get("uploaded", 0)
+                duplicates = status.get("duplicates", 0)
+                failed = status.get("failed", 0)
+                files = status.get("files", [])
+
+                summary_lines = [
+                    f"{DRY_RUN_PREFIX}Enemy upload completed for `{cleaned_enemy_id}` in {elapsed}s!",
+                    "**Summary:**",
+                    f"- Variants processed: {processed}",
+                    f"- Images uploaded: {uploaded}",
+                    f"- Images found as duplicates: {duplicates}",
+                    f"- Images failed validation: {failed}",
+                ]
 
-                if len(link_lines) > 2:
-                    summary_lines.extend(link_lines)
+                if files:
+                    # First entry per variant, in one pass over files
+                    by_variant: dict[str, dict] = {}
+                    for file_info in files:
+                        by_variant.setdefault(file_info.get("variant"), file_info)
+                    s_info = by_variant.get("s", {})
+                    m_info = by_variant.get("m", {})
+
+                    link_entries = [
+                        (label, file_name)
+                        for label, file_name in (
+                            ("Canonical S", s_info.get("canonical")),
+                            ("Canonical M", m_info.get("canonical")),
+                            ("Redirect S", s_info.get("redirect")),
+                            ("Redirect M", m_info.get("redirect")),
+                        )
+                        if file_name
+                    ]
+                    if link_entries:
+                        summary_lines.extend(["", "**Links:**"])
+                        summary_lines.extend(
+                            f"- {label}: <{wiki_page_url(f'File:{file_name}')}>"
+                            for label, file_name in link_entries
+                        )
 
-            await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
-        else:
-            msg = await edit_public_message(
-                msg,
-                content=(
-                    f"{dry_run_prefix}Enemy upload failed for `{cleaned_enemy_id}` "
-                    f"in {elapsed}s!"
+                await edit_or_followup_long_message(msg, interaction, "\n".join(summary_lines))
+            else:
+                msg = await edit_public_message(
+                    msg,
+                    content=(
+                        f"{DRY_RUN_PREFIX}Enemy upload failed for `{cleaned_enemy_id}` "
+                        f"in {elapsed}s!"
+                    )
                 )
-            )
-            if stderr.strip():
-                error_preview = stderr.strip()[:500]
-                await interaction.followup.send(f"Error details:\n```\n{error_preview}\n```")
+                await send_error_details(interaction, stderr)
 
-    except Exception as e:
-        elapsed = int(time.time() - start_time)
-        msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
+        except Exception as e:
+            elapsed = int(time.monotonic() - start_time)
+            msg = await edit_public_message(msg, f"Error while running script after {elapsed}s:\n```{e}```")
 
 
 # --- START BOT ---